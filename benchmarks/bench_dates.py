@@ -0,0 +1,86 @@
+"""Per-item cost of pubDate parsing + Persian formatting, before and after.
+
+    python benchmarks/bench_dates.py [--items N]
+
+"before" is the block rss_crawler.py used to run for every item (dateutil,
+a fresh ZoneInfo per call, six strftime calls and a new translation table
+per digit conversion); "after" is persian_date.parse_pub_date followed by
+format_persian_datetime.
+"""
+import argparse
+import os
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from zoneinfo import ZoneInfo
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import jdatetime
+from dateutil import parser
+
+from newsfeed.persian_date import PERSIAN_MONTHS, PERSIAN_WEEKDAYS, _format_minute, format_persian_datetime, parse_pub_date
+
+
+def to_persian_digits_before(s):
+    english_digits = "0123456789"
+    persian_digits = "۰۱۲۳۴۵۶۷۸۹"
+    return s.translate(str.maketrans(english_digits, persian_digits))
+
+
+def format_before(pub_date):
+    dt = parser.parse(pub_date)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=ZoneInfo("GMT"))
+    dt_tehran = dt.astimezone(ZoneInfo("Asia/Tehran"))
+    jd = jdatetime.datetime.fromgregorian(datetime=dt_tehran)
+    weekday_en = jd.strftime('%A')
+    weekday_fa = PERSIAN_WEEKDAYS.get(weekday_en, weekday_en)
+    day = to_persian_digits_before(jd.strftime('%d'))
+    month_en = jd.strftime('%B')
+    month_fa = PERSIAN_MONTHS.get(month_en, month_en)
+    year = to_persian_digits_before(jd.strftime('%Y'))
+    time_str = to_persian_digits_before(jd.strftime('%H:%M'))
+    return f"{weekday_fa}، {day} {month_fa} {year} ⏰ {time_str}"
+
+
+def format_after(pub_date):
+    return format_persian_datetime(parse_pub_date(pub_date))
+
+
+def sample_dates(n, seed=0):
+    # Roughly what a run sees: ~a day of items, many sharing a minute
+    rng = random.Random(seed)
+    tehran = timezone(timedelta(hours=3, minutes=30))
+    start = datetime(2026, 8, 22, tzinfo=tehran)
+    return [format_datetime(start + timedelta(minutes=rng.randrange(24 * 60))) for _ in range(n)]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--items", type=int, default=1000)
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    dates = sample_dates(args.items)
+    assert [format_before(d) for d in dates] == [format_after(d) for d in dates]
+
+    def run_after_cold():
+        _format_minute.cache_clear()
+        for d in dates:
+            format_after(d)
+
+    results = {
+        "before": min(timeit.repeat(lambda: [format_before(d) for d in dates], number=1, repeat=args.repeat)),
+        "after (cold memo)": min(timeit.repeat(run_after_cold, number=1, repeat=args.repeat)),
+        "after (warm memo)": min(timeit.repeat(lambda: [format_after(d) for d in dates], number=1, repeat=args.repeat)),
+    }
+    base = results["before"]
+    for name, seconds in results.items():
+        print(f"{name:<18} {seconds / len(dates) * 1e6:8.2f} µs/item  ({base / seconds:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
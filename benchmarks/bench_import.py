@@ -0,0 +1,99 @@
+"""Cold-start cost of the package, measured with ``python -X importtime``.
+
+    python benchmarks/bench_import.py [--repeat 5] [--threshold 0.25] [--update-baseline]
+
+Each target is imported in a fresh interpreter; the reported time is the sum
+of the per-module "self" times (best of --repeat runs), leaving out what a
+bare interpreter imports at startup. ``newsfeed`` and ``newsfeed.cli`` are
+what every command pays before doing anything; ``newsfeed.pipeline`` is the
+crawl path up to the first fetch (requests and lxml load only after that).
+Results are tracked under "cold-start" in benchmarks/baseline.json, like the
+pipeline stages.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCH_DIR)
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+BASELINE_KEY = "cold-start"
+TARGETS = ("newsfeed", "newsfeed.cli", "newsfeed.pipeline")
+MIN_SECONDS = 0.005  # imports faster than this are too noisy to flag
+
+
+def import_times(module):
+    """Return {module name: (self seconds, cumulative seconds)} for one fresh import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(own) / 1e6, int(cumulative) / 1e6)
+    return times
+
+
+def measure(module, repeat, startup):
+    """Best total import time of ``module`` (minus modules the bare interpreter
+    loads anyway) and its five heaviest top-level dependencies."""
+    import_times(module)  # write the .pyc files first
+    runs = [{name: t for name, t in import_times(module).items() if name not in startup} for _ in range(repeat)]
+    best = min(runs, key=lambda times: sum(own for own, _ in times.values()))
+    heaviest = sorted(
+        ((cumulative, name) for name, (_, cumulative) in best.items() if "." not in name and name != module),
+        reverse=True,
+    )[:5]
+    return sum(own for own, _ in best.values()), heaviest
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown vs baseline (0.25 = 25%%)")
+    arg_parser.add_argument("--baseline", default=BASELINE_PATH)
+    arg_parser.add_argument("--update-baseline", action="store_true", help="store these results as the new baseline")
+    args = arg_parser.parse_args()
+
+    startup = set(import_times("sys"))
+    results = {}
+    for module in TARGETS:
+        seconds, heaviest = measure(module, args.repeat, startup)
+        results[module] = seconds
+        print(f"{module:<20} {seconds * 1000:8.1f} ms   heaviest: " +
+              ", ".join(f"{name} {cumulative * 1000:.1f} ms" for cumulative, name in heaviest))
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    if args.update_baseline:
+        baseline[BASELINE_KEY] = {module: round(seconds, 5) for module, seconds in results.items()}
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=1)
+        print(f"✅ Baseline written to {args.baseline}")
+        return
+
+    if BASELINE_KEY not in baseline:
+        print("⚠️ No baseline yet; run with --update-baseline to create one")
+        return
+    regressions = []
+    for module, seconds in results.items():
+        before = baseline[BASELINE_KEY].get(module)
+        if before and seconds > MIN_SECONDS and seconds > before * (1 + args.threshold):
+            regressions.append(f"{module}: {before * 1000:.1f} ms -> {seconds * 1000:.1f} ms (+{(seconds / before - 1) * 100:.0f}%)")
+    for line in regressions:
+        print(f"❌ {line}")
+    if regressions:
+        sys.exit(1)
+    print(f"✅ No import slower than baseline by more than {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
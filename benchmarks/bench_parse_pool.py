@@ -0,0 +1,66 @@
+"""Speedup of the process-pool parse stage against the number of feeds.
+
+    python benchmarks/bench_parse_pool.py [--feeds 8,32,128,512] [--workers 2,4,8] [--repeat 3]
+
+The recorded fixtures are cycled to get the requested number of feed bodies,
+which are then parsed in-process (what crawl does by default) and through a
+ParsePool of each worker count. Pool timings include starting the workers and
+sending the articles back, as in a real crawl, so small crawls show where the
+pool stops paying for itself.
+"""
+import argparse
+import os
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from feed_fixtures import load_fixtures
+from newsfeed.parse_pool import ParsePool
+from newsfeed.parsing import parse_feed
+
+
+def parse_serial(bodies):
+    return [parse_feed(body)[0] for body in bodies]
+
+
+def parse_pooled(bodies, workers):
+    with ParsePool(workers) as pool:
+        futures = [pool.submit(body) for body in bodies]
+        return [future.result()[0] for future in futures]
+
+
+def best_of(repeat, fn):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--feeds", default="8,32,128,512", help="comma-separated feed counts")
+    arg_parser.add_argument("--workers", default=",".join(str(n) for n in sorted({2, 4, os.cpu_count() or 1})),
+                            help="comma-separated worker counts (default: 2, 4 and the CPU count)")
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    args = arg_parser.parse_args()
+
+    fixtures = [data for *_, data in load_fixtures()]
+    worker_counts = [int(n) for n in args.workers.split(",") if int(n) > 1]
+    print(f"{os.cpu_count()} CPUs; times are best of {args.repeat}")
+    print(f"{'feeds':>6} {'serial':>10}" + "".join(f" {f'{n} workers':>20}" for n in worker_counts))
+    for count in (int(n) for n in args.feeds.split(",")):
+        bodies = [fixtures[i % len(fixtures)] for i in range(count)]
+        serial = best_of(args.repeat, lambda: parse_serial(bodies))
+        row = f"{count:>6} {serial * 1000:8.0f}ms"
+        for workers in worker_counts:
+            pooled = best_of(args.repeat, lambda: parse_pooled(bodies, workers))
+            row += f" {pooled * 1000:8.0f}ms ({serial / pooled:4.2f}x)"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""Offline benchmark of every pipeline stage against recorded feed fixtures.
+
+    python benchmarks/bench_pipeline.py [--scenarios x1,x10] [--threshold 0.25] [--update-baseline]
+
+Each scenario (see feed_fixtures.SCENARIOS) is timed stage by stage: item
+extraction, date formatting, description cleaning, dedup, sorting (the
+newest-first merge of per-feed streams), MinHash signatures (computed once
+per article, when ArticleStore first saves it), clustering of signed
+articles and HTML rendering. Results are compared with
+benchmarks/baseline.json; a stage slower than baseline * (1 + threshold)
+is reported as a regression and the script exits with status 1.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from feed_fixtures import SCENARIOS, load_fixtures, scenario
+from newsfeed.article import merge_newest, sort_newest
+from newsfeed.article_store import normalize_link
+from newsfeed.clustering import cluster_articles, signature
+from newsfeed.feed_parser import clean_description, iter_items
+from newsfeed.parsing import parse_items
+from newsfeed.persian_date import _format_minute, format_persian_datetime, parse_pub_date
+from newsfeed.renderer import render_pages
+
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+MIN_SECONDS = 0.002  # stages faster than this are too noisy to flag
+DEFAULT_SCENARIOS = "x1,x10,big-desc,many-images"  # x100 takes a couple of minutes; ask for it explicitly
+
+
+def best_of(repeat, fn, setup=lambda: None):
+    best = float("inf")
+    for _ in range(repeat):
+        arg = setup()
+        start = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_scenario(feeds, repeat):
+    raw = [(category, source, list(iter_items(data))) for category, source, _, data in feeds]
+    items = [item for _, _, feed_items in raw for item in feed_items]
+    collected = []
+    for category, source, feed_items in raw:
+        articles, _ = parse_items(feed_items)
+        collected.append((category, [a._replace(source=source) for a in articles]))
+
+    def dates(_):
+        _format_minute.cache_clear()
+        for item in items:
+            format_persian_datetime(parse_pub_date(item["pubDate"].strip()))
+
+    def dedup(_):
+        seen = set()
+        streams = defaultdict(list)
+        for category, articles in collected:
+            current = []
+            for article in articles:
+                key = normalize_link(article.link)
+                if key not in seen:
+                    seen.add(key)
+                    current.append(article)
+            streams[category].append(current)
+        return streams
+
+    streams = dedup(None)
+
+    def merge(_):
+        return {category: merge_newest([sort_newest(s) for s in feed_streams]) for category, feed_streams in streams.items()}
+
+    category_articles = merge(None)
+
+    def sign(_):
+        return {category: [a._replace(minhash=signature(a)) for a in articles]
+                for category, articles in category_articles.items()}
+
+    signed = sign(None)
+
+    def render(_):
+        with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            try:
+                render_pages(category_articles, "benchmark")
+            finally:
+                os.chdir(cwd)
+
+    return {
+        "items": len(items),
+        "extract": best_of(repeat, lambda _: [list(iter_items(data)) for *_, data in feeds]),
+        "dates": best_of(repeat, dates),
+        "descriptions": best_of(repeat, lambda _: [clean_description(i["description"].strip()) for i in items]),
+        "dedup": best_of(repeat, dedup),
+        "sort": best_of(repeat, merge),
+        "signatures": best_of(repeat, sign),
+        "cluster": best_of(repeat, lambda _: [cluster_articles(a) for a in signed.values()]),
+        "render": best_of(repeat, render),
+    }
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, stages in results.items():
+        for stage, seconds in stages.items():
+            if stage == "items":
+                continue
+            before = baseline.get(name, {}).get(stage)
+            if before and seconds > MIN_SECONDS and seconds > before * (1 + threshold):
+                regressions.append(f"{name}/{stage}: {before * 1000:.1f} ms -> {seconds * 1000:.1f} ms (+{(seconds / before - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--scenarios", default=DEFAULT_SCENARIOS,
+                            help=f"comma-separated subset of {','.join(SCENARIOS)} (default: %(default)s)")
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown vs baseline (0.25 = 25%%)")
+    arg_parser.add_argument("--baseline", default=BASELINE_PATH)
+    arg_parser.add_argument("--update-baseline", action="store_true", help="store these results as the new baseline")
+    args = arg_parser.parse_args()
+
+    fixtures = load_fixtures()
+    results = {}
+    for name in args.scenarios.split(","):
+        results[name] = bench_scenario(scenario(name, fixtures), args.repeat)
+        stages = results[name]
+        print(f"{name:<12} {stages['items']:>7} items  " + "  ".join(
+            f"{stage} {seconds * 1000:8.1f} ms" for stage, seconds in stages.items() if stage != "items"))
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        baseline.update({name: {k: round(v, 5) for k, v in stages.items()} for name, stages in results.items()})
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=1)
+        print(f"✅ Baseline written to {args.baseline}")
+        return
+
+    try:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        print("⚠️ No baseline yet; run with --update-baseline to create one")
+        return
+    regressions = compare(results, baseline, args.threshold)
+    for line in regressions:
+        print(f"❌ {line}")
+    if regressions:
+        sys.exit(1)
+    print(f"✅ No stage slower than baseline by more than {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Scale test: crawl thousands of synthetic feeds and measure time, memory and output size.
+
+    python benchmarks/bench_scale.py [--feeds 100,1000,10000] [--categories 8] [--warm] [--json results.json]
+
+For each feed count a fresh subprocess runs the real crawl (collect and
+render, as ``python -m newsfeed crawl`` does) in an empty temp directory
+against a local synthetic_feeds server, with its own feed list spread over
+``--categories`` categories. The table shows wall time and the main stages,
+the child's peak RSS, the size of everything it wrote outside ``.cache`` and
+of desktop.html alone. With ``--warm`` each size is crawled a second time in
+the same directory, so feeds come back as 304s and articles from the store,
+as on the hourly workflow.
+
+Latency, error rate, feed size and duplicate ratio are the server's options
+(see synthetic_feeds.FeedConfig).
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from synthetic_feeds import FeedConfig, feed_urls, serve
+
+STAGES = ("fetch", "parse", "merge", "cluster", "index", "render", "write", "compress")
+
+
+def crawl_child(args):
+    """Run one crawl in the current process (the --child side)."""
+    from newsfeed.delta_feeds import DeltaFeeds
+    from newsfeed.pipeline import collect, render
+    from newsfeed.run_report import RunReport
+
+    os.chdir(args.workdir)
+    urls = feed_urls(args.child, args.hosts, args.port)
+    feeds = {}
+    for n, url in enumerate(urls):
+        feeds.setdefault(f"دسته {n % args.categories + 1}", {})[f"منبع {n}"] = url
+    report = RunReport()
+    deltas = DeltaFeeds()
+    category_articles = collect(feeds, report=report, deadline=args.deadline, parse_workers=args.parse_workers,
+                                deltas=deltas)
+    render(category_articles, report, deltas=deltas)
+    summary = report.as_dict()
+    result = {
+        "stages": summary["stages"], "feeds_failed": summary["feeds_failed"],
+        "articles": sum(len(articles) for articles in category_articles.values()),
+    }
+    with open("bench-result.json", "w", encoding="utf-8") as f:
+        json.dump(result, f)
+
+
+def tree_size(root, skip=".cache"):
+    total = 0
+    for directory, subdirs, files in os.walk(root):
+        if directory == root and skip in subdirs:
+            subdirs.remove(skip)
+        total += sum(os.path.getsize(os.path.join(directory, name)) for name in files)
+    return total
+
+
+def run_crawl(args, count, workdir):
+    command = [
+        sys.executable, os.path.abspath(__file__), "--child", str(count), "--workdir", workdir,
+        "--hosts", str(args.hosts), "--port", str(args.port), "--categories", str(args.categories),
+        "--deadline", str(args.deadline), "--parse-workers", str(args.parse_workers),
+    ]
+    start = time.perf_counter()
+    proc = subprocess.Popen(command, stdout=subprocess.DEVNULL)
+    # wait4 gives the resource usage of this child alone, including its peak RSS
+    _, status, usage = os.wait4(proc.pid, 0)
+    wall = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode:
+        sys.exit(f"⚠️ crawl of {count} feeds exited with status {proc.returncode}")
+    with open(os.path.join(workdir, "bench-result.json"), encoding="utf-8") as f:
+        result = json.load(f)
+    result.update(
+        feeds=count, wall_s=round(wall, 3), peak_rss_mb=round(usage.ru_maxrss / 1024, 1),
+        output_mb=round(tree_size(workdir) / 1024 ** 2, 2),
+        page_mb=round(os.path.getsize(os.path.join(workdir, "desktop.html")) / 1024 ** 2, 2),
+    )
+    return result
+
+
+def print_row(label, result):
+    stages = "".join(f" {result['stages'].get(stage, 0):7.2f}" for stage in STAGES)
+    print(f"{result['feeds']:>6} {label:>5} {result['articles']:>8} {result['feeds_failed']:>6} "
+          f"{result['wall_s']:7.1f}{stages} {result['peak_rss_mb']:8.0f} {result['output_mb']:8.1f} {result['page_mb']:7.2f}")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--feeds", default="100,1000,10000", help="comma-separated feed counts")
+    arg_parser.add_argument("--categories", type=int, default=8)
+    arg_parser.add_argument("--hosts", type=int, default=16, help="loopback addresses the feeds are spread over")
+    arg_parser.add_argument("--port", type=int, default=8700)
+    arg_parser.add_argument("--deadline", type=float, default=3600, help="crawl deadline, seconds")
+    arg_parser.add_argument("--parse-workers", type=int, default=0)
+    arg_parser.add_argument("--warm", action="store_true", help="also time a second, cached crawl of each size")
+    arg_parser.add_argument("--json", help="write the results to this file")
+    for field, default in FeedConfig._field_defaults.items():
+        arg_parser.add_argument(f"--{field.replace('_', '-')}", type=type(default), default=default,
+                                help=f"synthetic feeds: {field.replace('_', ' ')} (default {default})")
+    arg_parser.add_argument("--child", type=int, help=argparse.SUPPRESS)
+    arg_parser.add_argument("--workdir", help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    if args.child is not None:
+        crawl_child(args)
+        return
+
+    config = FeedConfig(**{field: getattr(args, field) for field in FeedConfig._fields})
+    servers = serve(config, args.hosts, args.port)
+    print(f"{os.cpu_count()} CPUs; {config}")
+    print(f"{'feeds':>6} {'run':>5} {'articles':>8} {'failed':>6} {'wall s':>7}"
+          + "".join(f" {stage:>7}" for stage in STAGES) + f" {'RSS MB':>8} {'out MB':>8} {'page MB':>7}")
+    results = []
+    try:
+        for count in (int(n) for n in args.feeds.split(",")):
+            with tempfile.TemporaryDirectory(prefix="newsfeed-scale-") as workdir:
+                for label in ("cold", "warm") if args.warm else ("cold",):
+                    result = run_crawl(args, count, workdir)
+                    result["run"] = label
+                    print_row(label, result)
+                    results.append(result)
+    finally:
+        for server in servers:
+            server.shutdown()
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"config": config._asdict(), "cpus": os.cpu_count(), "results": results}, f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Recorded feed fixtures and synthetic scaled-up variants for the benchmarks."""
+import gzip
+import json
+import os
+import re
+import zlib
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+ITEM_RE = re.compile(rb"<item\b.*?</item>", re.S)
+LINK_RE = re.compile(rb"<link>(.*?)</link>", re.S)
+TITLE_RE = re.compile(rb"<title>(.*?)</title>", re.S)
+DESC_RE = re.compile(rb"(<description>)(.*?)(</description>)", re.S)
+
+
+def load_fixtures(directory=FIXTURE_DIR):
+    """Return [(category, source, url, rss_bytes), ...] in the recorded feed order."""
+    with open(os.path.join(directory, "index.json"), encoding="utf-8") as f:
+        index = json.load(f)
+    feeds = []
+    for entry in index:
+        with gzip.open(os.path.join(directory, entry["file"]), "rb") as f:
+            feeds.append((entry["category"], entry["source"], entry["url"], f.read()))
+    return feeds
+
+
+def _copy_item(item, n):
+    if n == 0:
+        return item
+    suffix = str(n).encode()
+    item = LINK_RE.sub(lambda m: b"<link>" + m.group(1) + (b"&amp;" if b"?" in m.group(1) else b"?") + b"copy=" + suffix + b"</link>", item, count=1)
+    return TITLE_RE.sub(lambda m: b"<title>" + m.group(1) + b" " + suffix + b"</title>", item, count=1)
+
+
+def _big_description(item, factor=20):
+    return DESC_RE.sub(lambda m: m.group(1) + m.group(2) * factor + m.group(3), item, count=1)
+
+
+def _many_images(item, count=6):
+    enclosures = b"".join(
+        b'<enclosure url="https://img.example.com/%d/%d.jpg" type="image/jpeg" length="0"/>' % (zlib.crc32(item) & 0xFFFF, i)
+        for i in range(count)
+    )
+    return item.replace(b"</item>", enclosures + b"</item>")
+
+
+def transform_feed(rss_bytes, factor=1, big_desc=False, many_images=False):
+    """Scale a feed to ``factor`` times its items (unique links and titles per copy)."""
+    items = ITEM_RE.findall(rss_bytes)
+    if not items:
+        return rss_bytes
+    start = rss_bytes.index(items[0])
+    end = rss_bytes.rindex(items[-1]) + len(items[-1])
+    body = []
+    for n in range(factor):
+        for item in items:
+            item = _copy_item(item, n)
+            if big_desc:
+                item = _big_description(item)
+            if many_images:
+                item = _many_images(item)
+            body.append(item)
+    return rss_bytes[:start] + b"\n".join(body) + rss_bytes[end:]
+
+
+SCENARIOS = {
+    "x1": {},
+    "x10": {"factor": 10},
+    "x100": {"factor": 100},
+    "big-desc": {"big_desc": True},
+    "many-images": {"many_images": True},
+}
+
+
+def scenario(name, fixtures=None):
+    fixtures = fixtures if fixtures is not None else load_fixtures()
+    options = SCENARIOS[name]
+    return [(category, source, url, transform_feed(data, **options)) for category, source, url, data in fixtures]
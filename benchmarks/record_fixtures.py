@@ -0,0 +1,47 @@
+"""Record the live feeds in newsfeed.sources.feeds as benchmark fixtures.
+
+    python benchmarks/record_fixtures.py
+
+Needs network access; everything else under benchmarks/ runs offline from
+what this writes to benchmarks/fixtures/.
+"""
+import gzip
+import hashlib
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+from feed_fixtures import FIXTURE_DIR
+from newsfeed.fetching import FETCH_TIMEOUT
+from newsfeed.sources import feeds
+
+
+def main():
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    index = []
+    with requests.Session() as session:
+        for category, sources in feeds.items():
+            for source, url in sources.items():
+                try:
+                    response = session.get(url, timeout=FETCH_TIMEOUT)
+                    response.raise_for_status()
+                except requests.RequestException as e:
+                    print(f"⚠️ Skipping {source} ({url}): {e}")
+                    continue
+                name = hashlib.sha1(url.encode("utf-8")).hexdigest()[:12] + ".xml.gz"
+                with open(os.path.join(FIXTURE_DIR, name), "wb") as f:
+                    with gzip.GzipFile(fileobj=f, mode="wb", mtime=0, compresslevel=9) as gz:
+                        gz.write(response.content)
+                index.append({"category": category, "source": source, "url": url, "file": name})
+                print(f"📥 {source}: {len(response.content) / 1024:.1f} KB")
+    with open(os.path.join(FIXTURE_DIR, "index.json"), "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=1)
+    print(f"✅ Recorded {len(index)} feeds")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""Local HTTP server of synthetic Persian RSS feeds, for load tests.
+
+    python benchmarks/synthetic_feeds.py [--hosts 8] [--port 8700] [--latency 0.05] [--error-rate 0.02]
+
+Feed ``/feed/<n>.xml`` is generated from a seed of n, so every request for it
+returns the same document; it carries an ETag and revalidation gets a 304,
+like a well-behaved publisher. Feeds are spread over ``--hosts`` loopback
+addresses (127.0.0.1, 127.0.0.2, ...) so the crawler's per-host limits see
+many publishers rather than one.
+
+Each response waits ``latency`` seconds (uniformly jittered by half), and
+fails with a 503 with probability ``error_rate``. A ``duplicates`` fraction
+of items are stories shared between feeds (same link and title), as when
+several agencies carry one report. Text is drawn from a Zipf-distributed
+vocabulary (real words first, then thousands of made-up ones), so
+common terms are very common and most are rare, as in real news copy.
+"""
+import argparse
+import itertools
+import random
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FeedConfig = namedtuple(
+    "FeedConfig", "items desc_words latency error_rate duplicates image_ratio",
+    defaults=(30, 60, 0.05, 0.02, 0.1, 0.7),
+)
+
+TEHRAN = timezone(timedelta(hours=3, minutes=30))
+SHARED_STORIES = 500
+WORDS = (
+    "دولت مجلس بازار بورس بانک مرکزی نرخ ارز دلار طلا سکه تورم رشد اقتصادی صادرات واردات نفت گاز پتروشیمی "
+    "خودرو مسکن اجاره وام تسهیلات بودجه مالیات یارانه کالا قیمت تولید صنعت معدن تجارت سرمایه‌گذاری شرکت "
+    "سهام شاخص معاملات عرضه تقاضا وزیر رئیس‌جمهور نماینده جلسه تصویب طرح لایحه گزارش افزایش کاهش "
+    "درصد میلیارد تومان هزار ریال سال ماه هفته امروز تهران استان کشور جهانی منطقه همکاری توافق"
+).split()
+LETTERS = "ابپتثجچحخدرزسشصطعغفقکگلمنوهی"
+VOCABULARY_SIZE = 20000
+
+
+def _vocabulary():
+    rng = random.Random("vocabulary")
+    words = list(dict.fromkeys(WORDS))
+    while len(words) < VOCABULARY_SIZE:
+        words.append("".join(rng.choice(LETTERS) for _ in range(rng.randint(3, 8))))
+    return words, list(itertools.accumulate(1 / rank for rank in range(1, len(words) + 1)))
+
+
+VOCABULARY, CUMULATIVE_WEIGHTS = _vocabulary()
+
+
+def sentence(rng, words):
+    return " ".join(rng.choices(VOCABULARY, cum_weights=CUMULATIVE_WEIGHTS, k=words))
+
+
+def story(rng, config, feed, index, now):
+    """Return (link, title, description, image, published) for one item."""
+    if rng.random() < config.duplicates:
+        shared = rng.randrange(SHARED_STORIES)
+        shared_rng = random.Random(f"shared-{shared}")
+        link = f"https://agency.example/news/{shared}"
+        title = sentence(shared_rng, shared_rng.randint(6, 12))
+        desc = sentence(shared_rng, config.desc_words)
+    else:
+        link = f"https://site{feed % 97}.example/fa/news/{feed}/{index}"
+        title = sentence(rng, rng.randint(6, 12))
+        desc = sentence(rng, config.desc_words)
+    image = f"https://img{feed % 13}.example/{feed}/{index}.jpg" if rng.random() < config.image_ratio else None
+    published = now - timedelta(minutes=index * rng.randint(5, 40) + feed % 60)
+    return link, title, desc, image, published
+
+
+def feed_xml(feed, config, now):
+    rng = random.Random(feed)
+    items = []
+    for index in range(config.items):
+        link, title, desc, image, published = story(rng, config, feed, index, now)
+        if image and index % 2:
+            extra = f'<enclosure url="{image}" type="image/jpeg" length="0"/>'
+            description = f"<p>{escape(desc)}</p>"
+        else:
+            extra = ""
+            description = (f'<p><img src="{image}"/></p>' if image else "") + f"<p>{escape(desc)}</p>"
+        items.append(
+            f"<item><title>{escape(title)}</title><link>{link}</link>"
+            f"<description>{escape(description)}</description>"
+            f"<pubDate>{format_datetime(published)}</pubDate>{extra}</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="utf-8"?><rss version="2.0"><channel>'
+        f"<title>خبرگزاری آزمایشی {feed}</title><link>https://site{feed % 97}.example/</link>"
+        f"<description>فید آزمایشی</description>{''.join(items)}</channel></rss>"
+    ).encode("utf-8")
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        config, now = self.server.config, self.server.now
+        time.sleep(config.latency * random.uniform(0.5, 1.5))
+        try:
+            feed = int(self.path.rsplit("/", 1)[-1].split(".")[0])
+        except ValueError:
+            self.send_error(404)
+            return
+        if random.random() < config.error_rate:
+            self.send_error(503)
+            return
+        etag = f'"{feed}-{hash(config) & 0xffffffff:x}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        body = feed_xml(feed, config, now)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class FeedServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, address, config):
+        super().__init__(address, FeedHandler)
+        self.config = config
+        self.now = datetime.now(TEHRAN).replace(second=0, microsecond=0)
+
+
+def serve(config, hosts=8, port=8700):
+    """Start one server per loopback address in background threads; returns the servers."""
+    servers = [FeedServer((f"127.0.0.{host}", port), config) for host in range(1, hosts + 1)]
+    for server in servers:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    return servers
+
+
+def feed_urls(count, hosts=8, port=8700):
+    return [f"http://127.0.0.{n % hosts + 1}:{port}/feed/{n}.xml" for n in range(count)]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--hosts", type=int, default=8)
+    arg_parser.add_argument("--port", type=int, default=8700)
+    for field, default in FeedConfig._field_defaults.items():
+        arg_parser.add_argument(f"--{field.replace('_', '-')}", type=type(default), default=default)
+    args = arg_parser.parse_args()
+
+    config = FeedConfig(**{field: getattr(args, field) for field in FeedConfig._fields})
+    serve(config, args.hosts, args.port)
+    print(f"Serving synthetic feeds on 127.0.0.1-{args.hosts}:{args.port}, e.g. {feed_urls(1, args.hosts, args.port)[0]}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
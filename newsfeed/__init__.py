@@ -0,0 +1,29 @@
+"""Persian economic news aggregator: fetch RSS feeds, merge and render them.
+
+    from newsfeed import collect, render
+    render(collect())
+
+The entry points are resolved on first use, so importing the package loads
+nothing beyond this file.
+"""
+
+_ENTRY_POINTS = {
+    "fetch": ("fetching", "fetch_feeds"),
+    "parse": ("parsing", "parse_feed"),
+    "collect": ("pipeline", "collect"),
+    "render": ("pipeline", "render"),
+    "feeds": ("sources", "feeds"),
+}
+
+__all__ = list(_ENTRY_POINTS)
+
+
+def __getattr__(name):
+    if name not in _ENTRY_POINTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    module, attr = _ENTRY_POINTS[name]
+    value = getattr(import_module(f".{module}", __name__), attr)
+    globals()[name] = value
+    return value
@@ -0,0 +1,52 @@
+import heapq
+import itertools
+from collections import namedtuple
+from operator import attrgetter
+
+UNDATED = 0  # sort key of articles without a parseable pubDate: after every dated one
+
+_ArticleFields = namedtuple(
+    "Article", "title link desc date image gregorian source also sort_key minhash",
+    defaults=(None, (), UNDATED, None)
+)
+
+
+class Article(_ArticleFields):
+    """One news item: a plain tuple, so no per-instance dict and cheap to pickle.
+
+    ``sort_key`` is the publication time as integer epoch seconds, computed
+    once by ``Article.new`` so ordering never compares datetimes. ``also``
+    lists {"source", "link"} of near-duplicates merged into this article.
+    ``minhash`` is its clustering signature as kept by ArticleStore, or None
+    when it has not been computed yet.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def new(cls, title, link, desc, date, image, gregorian, source=None, minhash=None):
+        sort_key = int(gregorian.timestamp()) if gregorian else UNDATED
+        return cls(title, link, desc, date, image, gregorian, source, (), sort_key, minhash)
+
+
+newest_first_key = attrgetter("sort_key")
+
+
+def sort_newest(articles):
+    """Stable newest-first sort; cheap for feeds that already list newest first."""
+    return sorted(articles, key=newest_first_key, reverse=True)
+
+
+def merge_newest(streams, limit=None):
+    """Merge newest-first lists of articles into one newest-first list of at most ``limit``.
+
+    Ties keep stream order (then position within the stream), i.e. the result
+    is what a stable sort of the concatenated streams would give. When the
+    limit cuts, a heap k-way merge pulls only the newest ``limit`` articles;
+    when everything is kept, timsort merges the already-sorted runs in C,
+    which beats a heap driven from Python.
+    """
+    if limit is None or sum(map(len, streams)) <= limit:
+        return sort_newest(itertools.chain.from_iterable(streams))
+    merged = heapq.merge(*streams, key=newest_first_key, reverse=True)
+    return list(itertools.islice(merged, limit))
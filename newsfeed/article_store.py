@@ -0,0 +1,129 @@
+import os
+import sqlite3
+import time
+from datetime import datetime
+from urllib.parse import unquote, urlsplit, urlunsplit
+
+from .article import Article
+from .clustering import pack_signature, signature, unpack_signature
+
+STORE_PATH = os.path.join(".cache", "articles.db")
+RETENTION_DAYS = 2  # rows not seen in any feed for this long are evicted
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    key TEXT PRIMARY KEY,
+    category TEXT NOT NULL,
+    source TEXT NOT NULL,
+    title TEXT NOT NULL,
+    link TEXT NOT NULL,
+    desc TEXT,
+    date TEXT,
+    image TEXT,
+    gregorian TEXT,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    signature BLOB
+)
+"""
+
+
+def normalize_link(link):
+    """Canonical form of an article URL, used as the dedup and storage key."""
+    parts = urlsplit(link.strip())
+    query = "&".join(p for p in parts.query.split("&") if p and not p.startswith("utm_"))
+    path = unquote(parts.path).rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+
+def _row_to_article(row):
+    gregorian = datetime.fromisoformat(row["gregorian"]) if row["gregorian"] else None
+    minhash = unpack_signature(row["signature"]) if row["signature"] is not None else None
+    return Article.new(row["title"], row["link"], row["desc"], row["date"], row["image"], gregorian, row["source"],
+                       minhash)
+
+
+class ArticleStore:
+    """SQLite store of articles processed in earlier runs.
+
+    Keeps the derived fields (desc, date, image, gregorian) so an item that was
+    already seen skips date parsing and description cleaning, and lets the
+    renderer show articles that have since dropped out of their RSS window.
+    Each row also keeps its MinHash signature (see clustering.signature),
+    computed once when the article is stored or its text changes.
+    """
+
+    def __init__(self, path=STORE_PATH, retention_days=RETENTION_DAYS):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.retention = retention_days * 86400
+        self.now = time.time()
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.execute(SCHEMA)
+        if "signature" not in {row["name"] for row in self.db.execute("PRAGMA table_info(articles)")}:
+            self.db.execute("ALTER TABLE articles ADD COLUMN signature BLOB")  # stores from before signatures were kept
+
+    def get(self, link):
+        row = self.db.execute("SELECT * FROM articles WHERE key = ?", (normalize_link(link),)).fetchone()
+        return _row_to_article(row) if row else None
+
+    def save(self, category, article):
+        """Insert or update ``article``; returns (the article with its ``minhash``, whether it was not stored before).
+
+        The stored signature is kept while title and description stay the same;
+        only new or edited articles have theirs computed.
+        """
+        key = normalize_link(article.link)
+        gregorian = article.gregorian.isoformat() if article.gregorian else None
+        row = self.db.execute(
+            """
+            INSERT INTO articles (key, category, source, title, link, desc, date, image, gregorian, first_seen, last_seen)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(key) DO UPDATE SET
+                title = excluded.title, desc = excluded.desc, date = excluded.date,
+                image = excluded.image, gregorian = excluded.gregorian, last_seen = excluded.last_seen,
+                signature = CASE WHEN title = excluded.title AND desc IS excluded.desc THEN signature END
+            RETURNING first_seen, signature
+            """,
+            (
+                key, category, article.source, article.title, article.link,
+                article.desc, article.date, article.image, gregorian, self.now, self.now,
+            ),
+        ).fetchone()
+        if row["signature"] is None:
+            minhash = signature(article)
+            self.db.execute("UPDATE articles SET signature = ? WHERE key = ?", (pack_signature(minhash), key))
+        else:
+            minhash = unpack_signature(row["signature"])
+        return article._replace(minhash=minhash), row["first_seen"] == self.now
+
+    def snapshot(self):
+        """Return {key: article} for every stored row, for lookups outside this process."""
+        return {row["key"]: _row_to_article(row) for row in self.db.execute("SELECT * FROM articles")}
+
+    def history(self, category, exclude=()):
+        """Yield the retained articles of ``category`` newest first, skipping keys in ``exclude``.
+
+        Rows are read lazily, so a caller that stops early never loads the rest.
+        """
+        # ISO timestamps all carry Tehran's offset, so they sort as text; undated rows (NULL) come last
+        rows = self.db.execute(
+            "SELECT * FROM articles WHERE category = ? AND last_seen >= ? ORDER BY gregorian DESC, first_seen",
+            (category, self.now - self.retention),
+        )
+        for row in rows:
+            if row["key"] not in exclude:
+                yield _row_to_article(row)
+
+    def evict(self):
+        cursor = self.db.execute("DELETE FROM articles WHERE last_seen < ?", (self.now - self.retention,))
+        return cursor.rowcount
+
+    def checkpoint(self):
+        """Commit and restart the clock, for long-lived stores that save in rounds."""
+        self.db.commit()
+        self.now = time.time()
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
@@ -0,0 +1,131 @@
+import argparse
+import os
+import sys
+
+from .run_report import REPORT_PATH
+
+PROFILE_PATH = os.path.join(".cache", "profile.pstats")
+BENCHMARK_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks")
+BENCHMARKS = {
+    "pipeline": "bench_pipeline.py",
+    "dates": "bench_dates.py",
+    "import": "bench_import.py",
+    "parse-pool": "bench_parse_pool.py",
+    "scale": "bench_scale.py",
+}
+
+# The pipeline modules are imported inside the commands, so `--help` and
+# `bench` don't pay for lxml, requests or sqlite3.
+
+def crawl(args):
+    from .delta_feeds import DeltaFeeds
+    from .pipeline import collect, render, write_report
+    from .run_report import RunReport
+
+    report = RunReport()
+    deltas = DeltaFeeds() if args.deltas else None
+    category_articles = collect(report=report, deadline=args.deadline, parse_workers=args.parse_workers,
+                                deltas=deltas)
+    render(category_articles, report, json_mode=args.json_mode, fragments=args.fragments, compress=args.compress,
+           thumbnails=args.thumbnails, deltas=deltas)
+    write_report(report, args.report, args.prometheus)
+
+def render_only(args):
+    """Re-render the pages from the article store without fetching anything."""
+    from .article_store import ArticleStore
+    from .delta_feeds import DeltaFeeds
+    from .pipeline import feed_entries, merge_articles, render, write_report
+    from .run_report import RunReport
+    from .sources import feeds
+
+    report = RunReport()
+    store = ArticleStore()
+    try:
+        category_articles = merge_articles(feed_entries(feeds), {}, store, report)
+    finally:
+        store.close()
+    render(category_articles, report, json_mode=args.json_mode, fragments=args.fragments, compress=args.compress,
+           thumbnails=args.thumbnails, deltas=DeltaFeeds() if args.deltas else None)
+    write_report(report, args.report, args.prometheus)
+
+def daemon(args):
+    from .daemon import run_daemon
+
+    run_daemon(args)
+
+def bench(args):
+    import runpy
+
+    path = os.path.join(BENCHMARK_DIR, BENCHMARKS[args.suite])
+    if not os.path.exists(path):
+        sys.exit(f"⚠️ {path} not found; benchmarks run from a source checkout")
+    sys.argv = [path, *args.bench_args]
+    sys.path.insert(0, BENCHMARK_DIR)  # as when the script is run directly
+    runpy.run_path(path, run_name="__main__")
+
+def profiled(command, args):
+    import cProfile
+    import pstats
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.runcall(command, args)
+    finally:
+        os.makedirs(os.path.dirname(args.profile) or ".", exist_ok=True)
+        profiler.dump_stats(args.profile)
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+        print(f"📊 Profile written to {args.profile}")
+
+def make_parser():
+    arg_parser = argparse.ArgumentParser(prog="newsfeed", description="Crawl the news feeds and render desktop.html / mobile.html.")
+    commands = arg_parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("--report", default=REPORT_PATH, help="where to write the JSON run report")
+    output.add_argument("--prometheus", metavar="PATH", help="also write a Prometheus textfile")
+    output.add_argument("--fragments", action="store_true",
+                        help="also write each category column to fragments/ (only changed ones are rewritten)")
+    output.add_argument("--no-compress", dest="compress", action="store_false",
+                        help="don't write .gz/.br siblings and manifest.json")
+    output.add_argument("--no-deltas", dest="deltas", action="store_false",
+                        help="don't publish the JSON Feeds, NDJSON log and change files under api/")
+    output.add_argument("--json-mode", action=argparse.BooleanOptionalAction,
+                        help="load articles past each category's limit from <page>.json on scroll "
+                             "instead of writing archive pages (default: pipeline.JSON_MODE)")
+    output.add_argument("--thumbnails", action="store_true",
+                        help="serve article images as local thumbnails (needs Pillow)")
+    output.add_argument("--profile", nargs="?", const=PROFILE_PATH, metavar="PATH",
+                        help="run under cProfile and dump stats to PATH")
+
+    crawl_parser = commands.add_parser("crawl", parents=[output], help="fetch every feed and render the pages (default)")
+    crawl_parser.add_argument("--deadline", type=float,
+                              help="seconds the fetch phase may take in total (default 60); late feeds use the cache")
+    crawl_parser.add_argument("--parse-workers", type=int, default=0, metavar="N",
+                              help="parse feeds in N worker processes (0 or 1: in this process)")
+    crawl_parser.add_argument("--daemon", action="store_true",
+                              help="keep running and poll each feed on its own adaptive interval")
+    crawl_parser.add_argument("--min-interval", type=float, help="daemon: shortest polling interval in seconds")
+    crawl_parser.add_argument("--max-interval", type=float, help="daemon: longest polling interval in seconds")
+    crawl_parser.add_argument("--debounce", type=float, help="daemon: seconds without new articles before re-rendering")
+    crawl_parser.set_defaults(command=crawl)
+
+    render_parser = commands.add_parser("render-only", parents=[output], help="re-render the pages from stored articles")
+    render_parser.set_defaults(command=render_only)
+
+    bench_parser = commands.add_parser("bench", help="run an offline benchmark from benchmarks/")
+    bench_parser.add_argument("suite", nargs="?", choices=BENCHMARKS, default="pipeline")
+    bench_parser.add_argument("bench_args", nargs=argparse.REMAINDER, help="passed on to the benchmark script")
+    bench_parser.set_defaults(command=bench, profile=None)
+    return arg_parser
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0].startswith("-") and argv[0] not in ("-h", "--help"):
+        argv = ["crawl", *argv]  # `python rss_crawler.py [--report ...]` keeps working
+    args = make_parser().parse_args(argv)
+
+    command = daemon if getattr(args, "daemon", False) else args.command
+    if args.profile:
+        profiled(command, args)
+    else:
+        command(args)
@@ -0,0 +1,92 @@
+import hashlib
+import random
+import struct
+
+from .persian_text import tokenize
+
+# MinHash signature split into LSH bands: two articles become candidates when
+# any band matches exactly, which for 6 bands of 4 rows kicks in around a
+# Jaccard similarity of 0.6 while never comparing all pairs.
+NUM_HASHES = 24
+BANDS = 6
+ROWS = NUM_HASHES // BANDS
+SIMILARITY_THRESHOLD = 0.5  # share of equal MinHash values needed to merge candidates
+MIN_FEATURES = 4            # too little text to tell stories apart reliably
+
+_rng = random.Random(1402)
+MASKS = tuple(_rng.getrandbits(64) for _ in range(NUM_HASHES))
+SIGNATURE_STRUCT = struct.Struct(f"<{NUM_HASHES}Q")  # how ArticleStore keeps a signature
+
+
+def feature_hash(feature):
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def features(article):
+    words = tokenize(f"{article.title} {article.desc or ''}")
+    return {f"{a} {b}" for a, b in zip(words, words[1:])}
+
+
+def signature(article):
+    """MinHash signature of the article's text, or () when there is too little of it."""
+    shingles = features(article)
+    if len(shingles) < MIN_FEATURES:
+        return ()
+    hashes = [feature_hash(f) for f in shingles]
+    return tuple(min(map(mask.__xor__, hashes)) for mask in MASKS)
+
+
+def pack_signature(sig):
+    return SIGNATURE_STRUCT.pack(*sig) if sig else b""
+
+
+def unpack_signature(data):
+    return SIGNATURE_STRUCT.unpack(data) if data else ()
+
+
+def similarity(a, b):
+    return sum(x == y for x, y in zip(a, b)) / NUM_HASHES
+
+
+def cluster_articles(articles):
+    """Collapse near-duplicate stories into one card per story.
+
+    ``articles`` is a category list in display order. The first article of each
+    cluster is kept and gets an ``also`` list of ``{"source", "link"}`` for the
+    others, which are dropped from the returned list. Signatures the store
+    already holds (``Article.minhash``) are used as they are.
+    """
+    parent = list(range(len(articles)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    buckets = {}
+    signatures = [article.minhash if article.minhash is not None else signature(article) for article in articles]
+    for i, sig in enumerate(signatures):
+        if not sig:
+            continue
+        for band in range(BANDS):
+            key = (band, sig[band * ROWS:(band + 1) * ROWS])
+            j = buckets.setdefault(key, i)
+            if j == i:
+                continue
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j and similarity(sig, signatures[j]) >= SIMILARITY_THRESHOLD:
+                # keep the earlier article as the root so it stays the representative
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    clustered = []
+    members = {}
+    for i, article in enumerate(articles):
+        root = find(i)
+        if root == i:
+            article = article._replace(also=[])
+            members[i] = article
+            clustered.append(article)
+        else:
+            members[root].also.append({"source": article.source, "link": article.link})
+    return clustered
@@ -0,0 +1,95 @@
+import gzip
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .output import atomic_write, write_if_changed
+
+MANIFEST_PATH = "manifest.json"
+MANIFEST_VERSION = 1
+COMPRESS_WORKERS = 2  # zlib and brotli release the GIL, so threads compress in parallel with rendering
+STATIC_FILES = ("index.html", "search.html")  # hand-written pages served next to the generated ones
+
+
+def _brotli():
+    # Optional: brotli is not in the workflow's dependency list
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+class Compressor:
+    """Writes maximum-compression ``.gz`` (and ``.br`` when brotli is installed)
+    siblings of output files, plus a manifest for static hosting.
+
+    ``submit`` queues a file and returns at once; compression runs on a small
+    thread pool while the caller goes on rendering. A file whose SHA-256
+    matches its manifest entry, and whose siblings exist, is not compressed
+    again. ``finish`` waits for the queue, deletes siblings of files that are
+    no longer produced and writes ``manifest.json``: per file its size,
+    compressed sizes, hash and a strong ETag, so a server or CDN can serve the
+    precompressed bytes directly.
+    """
+
+    def __init__(self, manifest_path=MANIFEST_PATH, workers=COMPRESS_WORKERS):
+        self.manifest_path = manifest_path
+        self.brotli = _brotli()
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        self.futures = {}
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                self.previous = json.load(f).get("files", {})
+        except (OSError, ValueError):
+            self.previous = {}
+
+    def submit(self, path):
+        path = os.path.normpath(path).replace(os.sep, "/")
+        if path not in self.futures:
+            self.futures[path] = self.pool.submit(self._compress, path)
+
+    def _compress(self, path):
+        with open(path, "rb") as f:
+            data = f.read()
+        digest = hashlib.sha256(data).hexdigest()
+        entry = self.previous.get(path)
+        if (entry and entry["sha256"] == digest and os.path.exists(path + ".gz")
+                and (self.brotli is None or entry.get("br") is not None and os.path.exists(path + ".br"))):
+            return entry, False
+
+        # mtime=0 keeps the .gz bytes a pure function of the input, so unchanged files don't show up in git
+        gz = gzip.compress(data, compresslevel=9, mtime=0)
+        atomic_write(path + ".gz", gz)
+        br = None
+        if self.brotli is not None:
+            br = self.brotli.compress(data, quality=11)
+            atomic_write(path + ".br", br)
+        entry = {"sha256": digest, "etag": f'"{digest[:32]}"', "size": len(data), "gzip": len(gz),
+                 "br": len(br) if br is not None else None}
+        return entry, True
+
+    def finish(self):
+        """Wait for pending files, write the manifest and return (files, compressed, bytes saved by gzip)."""
+        files = {}
+        compressed = 0
+        try:
+            for path, future in self.futures.items():
+                files[path], changed = future.result()
+                compressed += changed
+        finally:
+            self.pool.shutdown()
+
+        for path in self.previous:
+            if path not in files:
+                for ext in (".gz", ".br"):
+                    if os.path.exists(path + ext):
+                        os.remove(path + ext)
+
+        manifest = {"version": MANIFEST_VERSION, "files": dict(sorted(files.items()))}
+        write_if_changed(self.manifest_path, json.dumps(manifest, ensure_ascii=False, indent=1))
+        saved = sum(entry["size"] - entry["gzip"] for entry in files.values())
+        print(f"🗜️ Compression: {len(files)} files, {compressed} recompressed"
+              f"{'' if self.brotli else ' (gzip only, brotli not installed)'}, {saved / 1024:.1f} KB saved by gzip")
+        return files, compressed, saved
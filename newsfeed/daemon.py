@@ -0,0 +1,169 @@
+import heapq
+import itertools
+import signal
+import statistics
+import sys
+import time
+
+from .article_store import ArticleStore, normalize_link
+from .delta_feeds import DeltaFeeds
+from .feed_cache import FeedCache
+from .feed_profiles import FeedProfiles
+from .fetch_policy import CRAWL_DEADLINE, CircuitBreaker, Deadline
+from .fetching import fetch_feeds
+from .pipeline import feed_entries, load_feed, merge_articles, render, write_report
+from .run_report import RunReport
+from .sources import feeds
+
+MIN_INTERVAL = 120       # seconds; never poll a feed more often than this
+MAX_INTERVAL = 3600      # ...or less often than this (the old hourly cron)
+INITIAL_INTERVAL = 600
+POLL_FRACTION = 0.5      # poll about twice per typical gap between a feed's items
+BACKOFF = 1.5            # stretch the interval after a poll that brought nothing new
+RATE_WINDOW = 10         # most recent items used to estimate a feed's publish rate
+DEBOUNCE = 30            # wait for this much quiet before re-rendering...
+MAX_RENDER_DELAY = 300   # ...but never hold new articles back longer than this
+
+
+def publish_gap(articles, window=RATE_WINDOW):
+    """Median number of seconds between a feed's most recent items, or None."""
+    times = sorted((a.sort_key for a in articles if a.gregorian), reverse=True)[:window]
+    gaps = [newer - older for newer, older in zip(times, times[1:])]
+    return statistics.median(gaps) if gaps else None
+
+
+def next_interval(interval, articles, new_items, min_interval=MIN_INTERVAL, max_interval=MAX_INTERVAL):
+    """Polling interval for a feed after a poll that found ``new_items`` new articles.
+
+    Busy feeds converge on a fraction of their publish gap; a poll with
+    nothing new backs off, but not below what the publish gap suggests.
+    """
+    gap = publish_gap(articles)
+    target = gap * POLL_FRACTION if gap else interval
+    if new_items:
+        interval = min(interval, target)
+    else:
+        interval = max(target, interval * BACKOFF)
+    return min(max(interval, min_interval), max_interval)
+
+
+class FeedScheduler:
+    """Min-heap of (due time, feed url): the next feed to poll is always on top."""
+
+    def __init__(self, urls, now):
+        self.order = itertools.count()  # tie-breaker keeps equal due times in feed order
+        self.heap = [(now, next(self.order), url) for url in urls]
+        heapq.heapify(self.heap)
+
+    def schedule(self, url, when):
+        heapq.heappush(self.heap, (when, next(self.order), url))
+
+    def pop_due(self, now):
+        due = []
+        while self.heap and self.heap[0][0] <= now:
+            due.append(heapq.heappop(self.heap)[2])
+        return due
+
+    def next_due(self):
+        return self.heap[0][0]
+
+
+class Daemon:
+    """Keeps the crawl state in memory and polls each feed on its own interval.
+
+    Outputs are re-rendered only after a poll brings in new articles, once
+    polling has been quiet for ``debounce`` seconds (or after
+    MAX_RENDER_DELAY at the latest).
+    """
+
+    def __init__(self, args, feeds=feeds):
+        self.args = args
+        self.min_interval = args.min_interval or MIN_INTERVAL
+        self.max_interval = args.max_interval or MAX_INTERVAL
+        self.debounce = DEBOUNCE if args.debounce is None else args.debounce
+        self.feed_list = feed_entries(feeds)
+        self.sources = {url: source for _, source, url in self.feed_list}
+        self.cache = FeedCache()
+        self.profiles = FeedProfiles()
+        self.store = ArticleStore()
+        self.report = RunReport()
+        self.breaker = CircuitBreaker()
+        self.deadline = args.deadline or CRAWL_DEADLINE
+        self.feed_articles = {}  # url -> articles from the latest successful poll
+        self.intervals = {url: min(max(INITIAL_INTERVAL, self.min_interval), self.max_interval) for url in self.sources}
+        self.scheduler = FeedScheduler(self.sources, time.monotonic())
+        self.first_change = self.last_change = None
+
+    def poll(self, urls):
+        fetched = fetch_feeds(urls, self.cache, self.report, Deadline(self.deadline), self.breaker)
+        for url, response, fetch_error in fetched:
+            print(f"📥 Reading from: {self.sources[url]} -> {url}")
+            previous = self.feed_articles.get(url, [])
+            articles, new_items = previous, 0
+            try:
+                if fetch_error is not None:
+                    raise fetch_error
+                articles = load_feed(url, response, self.cache, self.store, self.report, self.profiles)
+                known = {normalize_link(a.link) for a in previous}
+                new_items = sum(1 for a in articles if normalize_link(a.link) not in known)
+                self.feed_articles[url] = articles
+            except Exception as e:
+                self.report.error(url, "fetch" if fetch_error is not None else "parse", e)
+                stale = self.cache.fallback(url) if url not in self.feed_articles else None
+                if stale:
+                    # Nothing in memory yet (first poll): start from the last good copy
+                    self.feed_articles[url] = articles = stale
+                    new_items = len(stale)
+                    self.report.feed(url, stale=True)
+
+            interval = next_interval(self.intervals[url], articles, new_items, self.min_interval, self.max_interval)
+            self.intervals[url] = interval
+            self.report.feed(url, interval_s=round(interval))
+            now = time.monotonic()
+            self.scheduler.schedule(url, now + interval)
+            if new_items:
+                self.first_change = self.first_change or now
+                self.last_change = now
+
+    def render_due(self):
+        """Monotonic time of the next render, or None while nothing new has arrived."""
+        if self.first_change is None:
+            return None
+        return min(self.last_change + self.debounce, self.first_change + MAX_RENDER_DELAY)
+
+    def render(self):
+        self.first_change = self.last_change = None
+        self.store.checkpoint()
+        self.profiles.save()
+        deltas = DeltaFeeds() if self.args.deltas else None
+        category_articles = merge_articles(self.feed_list, self.feed_articles, self.store, self.report, deltas=deltas)
+        render(category_articles, self.report, json_mode=self.args.json_mode, fragments=self.args.fragments,
+               compress=self.args.compress, thumbnails=self.args.thumbnails, deltas=deltas)
+        write_report(self.report, self.args.report, self.args.prometheus)
+        self.report = RunReport()
+
+    def run(self):
+        print(f"🛰️ Daemon: {len(self.sources)} feeds, polling every {self.min_interval:.0f}-{self.max_interval:.0f}s")
+        try:
+            while True:
+                due = self.scheduler.pop_due(time.monotonic())
+                if due:
+                    self.poll(due)
+                render_at = self.render_due()
+                if render_at is not None and time.monotonic() >= render_at:
+                    self.render()
+                    render_at = None
+                wake = self.scheduler.next_due() if render_at is None else min(self.scheduler.next_due(), render_at)
+                time.sleep(max(wake - time.monotonic(), 0))
+        finally:
+            self.store.close()
+
+
+def run_daemon(args):
+    # systemd and docker stop with SIGTERM; exit through the same path as Ctrl-C
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        Daemon(args).run()
+    except KeyboardInterrupt:
+        pass
+    print("👋 Daemon stopped")
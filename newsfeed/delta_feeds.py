@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import re
+import time
+from datetime import datetime
+
+from .article_store import normalize_link
+from .output import atomic_write, write_if_changed
+from .persian_date import TEHRAN
+
+API_DIR = "api"  # published next to the pages
+STATE_PATH = os.path.join(".cache", "delta-state.json")
+JSON_FEED_VERSION = "https://jsonfeed.org/version/1.1"
+FEED_ITEMS = 50      # newest articles per category feed
+KEEP_CHANGES = 400   # per-run change files kept (about three weeks of hourly runs)
+LOG_DAYS = 14        # daily NDJSON logs kept
+CHANGE_FILE_RE = re.compile(r"^(\d+)\.json(\.gz|\.br)?$")  # anything else in changes/ is left alone
+
+
+def json_feed_item(article):
+    item = {
+        "id": normalize_link(article.link),
+        "url": article.link,
+        "title": article.title,
+        "content_text": article.desc or article.title,
+        "authors": [{"name": article.source}],
+    }
+    if article.gregorian:
+        item["date_published"] = article.gregorian.isoformat()
+    if article.image:
+        item["image"] = article.image
+    if article.also:
+        item["_newsfeed"] = {"also": [{"source": other["source"], "url": other["link"]} for other in article.also]}
+    return item
+
+
+def _dumps(data):
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _read_seq(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return int(json.load(f)["seq"] or 0)
+    except (OSError, ValueError, KeyError, TypeError):
+        return 0
+
+
+class DeltaFeeds:
+    """Machine-readable outputs for clients that poll instead of scraping the pages.
+
+    Under ``api/``:
+
+    * ``feeds/<key>.json`` -- a JSON Feed of each category's newest articles,
+      listed with the current sequence number in ``state.json``;
+    * ``log/<YYYY-MM-DD>.ndjson`` -- every new article, one
+      ``{"seq", "category", "item"}`` line each, appended as the article is
+      first stored rather than when the run ends;
+    * ``changes/<seq>.json`` -- the lines one run appended. A client that has
+      seen sequence N reads ``state.json`` and fetches N+1 up to ``seq``, or
+      the full feeds again when N is older than ``oldest_change``.
+
+    A run gets the next sequence number when it finds its first new article;
+    runs that find nothing leave every file alone.
+    """
+
+    def __init__(self, directory=API_DIR, state_path=STATE_PATH):
+        self.directory = directory
+        self.state_path = state_path
+        # The published state.json counts too: a fresh checkout or a cleared cache
+        # must not hand out numbers that clients have already seen
+        self.last_seq = max(_read_seq(state_path), _read_seq(os.path.join(directory, "state.json")))
+        self.seq = None
+        self.lines = []
+        self.log = None
+
+    def add(self, category, article):
+        """Log a newly stored article."""
+        if self.seq is None:
+            # Claim the number before anything is written, so a crashed run can't hand it out twice
+            self.seq = self.last_seq + 1
+            atomic_write(self.state_path, _dumps({"seq": self.seq}))
+            log_path = os.path.join(self.directory, "log", f"{datetime.now(TEHRAN):%Y-%m-%d}.ndjson")
+            os.makedirs(os.path.dirname(log_path), exist_ok=True)
+            self.log = open(log_path, "a", encoding="utf-8")
+        line = _dumps({"seq": self.seq, "category": category, "item": json_feed_item(article)})
+        self.lines.append(line)
+        self.log.write(line + "\n")
+        self.log.flush()
+
+    def feed_path(self, category):
+        key = hashlib.sha1(category.encode("utf-8")).hexdigest()[:8]
+        return os.path.join(self.directory, "feeds", f"{key}.json")
+
+    def publish(self, category_articles):
+        """Write the category feeds, this run's change file and state.json.
+
+        Returns the paths of the feeds and state.json, which are rewritten only
+        when their content changed.
+        """
+        if self.log is not None:
+            self.log.close()
+            self.log = None
+        seq = self.seq or self.last_seq
+        paths = []
+        feeds = []
+        for category, articles in category_articles.items():
+            path = self.feed_path(category)
+            feed = {"version": JSON_FEED_VERSION, "title": category, "language": "fa",
+                    "items": [json_feed_item(article) for article in articles[:FEED_ITEMS]]}
+            write_if_changed(path, _dumps(feed))
+            paths.append(path)
+            feeds.append({"category": category, "feed": os.path.relpath(path, self.directory)})
+        current = {os.path.basename(path) for path in paths}
+        # Only the feeds themselves; their .gz/.br siblings belong to the compressor, which drops stale ones
+        self._prune(os.path.join(self.directory, "feeds"), lambda name: name.endswith(".json") and name not in current)
+
+        changes_dir = os.path.join(self.directory, "changes")
+        if self.seq is not None:
+            path = os.path.join(changes_dir, f"{self.seq}.json")
+            atomic_write(path, "[" + ",".join(self.lines) + "]")
+            self._prune(changes_dir, self._expired_change)
+            cutoff = f"{datetime.fromtimestamp(time.time() - LOG_DAYS * 86400, TEHRAN):%Y-%m-%d}.ndjson"
+            self._prune(os.path.join(self.directory, "log"), lambda name: name < cutoff)
+            print(f"📡 Delta feeds: run {self.seq}, {len(self.lines)} new articles logged")
+        oldest = max(seq - KEEP_CHANGES + 1, 1)
+        state = {"seq": seq, "oldest_change": oldest if seq else None, "feeds": feeds}
+        state_path = os.path.join(self.directory, "state.json")
+        write_if_changed(state_path, _dumps(state))
+        return paths + [state_path]
+
+    def _expired_change(self, name):
+        match = CHANGE_FILE_RE.match(name)
+        return match is not None and int(match.group(1)) <= self.seq - KEEP_CHANGES
+
+    def _prune(self, directory, expired):
+        if not os.path.isdir(directory):
+            return
+        for name in os.listdir(directory):
+            if expired(name):
+                os.remove(os.path.join(directory, name))
@@ -0,0 +1,98 @@
+import hashlib
+import json
+import os
+from datetime import datetime
+
+from .article import Article
+
+CACHE_DIR = os.path.join(".cache", "feeds")
+
+
+class FeedCache:
+    """On-disk cache of feed responses keyed by feed URL.
+
+    For every feed we keep the HTTP validators (ETag / Last-Modified), the body
+    size and the articles parsed from it. When the server answers a conditional
+    request with 304 the stored articles are reused as-is.
+    """
+
+    def __init__(self, directory=CACHE_DIR):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.stale = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url, ext):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{key}.{ext}")
+
+    def _load(self, url):
+        try:
+            with open(self._path(url, "json"), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def validators(self, url):
+        entry = self._load(url)
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def items(self, url):
+        """Return the articles cached for ``url`` and count a hit, or None."""
+        entry = self._load(url)
+        if entry is None:
+            return None
+        self.hits += 1
+        self.bytes_saved += entry.get("size", 0)
+        return _articles(entry)
+
+    def fallback(self, url):
+        """Return the last good articles for a feed that could not be fetched, or None."""
+        entry = self._load(url)
+        if entry is None:
+            return None
+        self.stale += 1
+        return _articles(entry)
+
+    def store(self, url, response, articles):
+        self.misses += 1
+        if response.status_code != 200:
+            return
+        entry = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "size": len(response.content),
+            "items": [
+                {
+                    "title": article.title, "link": article.link, "desc": article.desc, "date": article.date,
+                    "image": article.image, "gregorian": article.gregorian.isoformat() if article.gregorian else None,
+                }
+                for article in articles
+            ],
+        }
+        with open(self._path(url, "json"), "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+
+    def summary(self):
+        line = f"🗄️ Feed cache: {self.hits} hits, {self.misses} misses, {self.bytes_saved / 1024:.1f} KB saved"
+        if self.stale:
+            line += f", {self.stale} stale feeds served"
+        return line
+
+
+def _articles(entry):
+    return [
+        Article.new(item["title"], item["link"], item["desc"], item["date"], item["image"],
+                    datetime.fromisoformat(item["gregorian"]) if item["gregorian"] else None)
+        for item in entry["items"]
+    ]
@@ -0,0 +1,115 @@
+import html
+import io
+import re
+
+MEDIA_NS = "http://search.yahoo.com/mrss/"
+
+TEXT_FIELDS = ("title", "link", "pubDate", "description")
+IMAGE_SOURCES = ("enclosure", "media_thumbnail", "media_content", "description")  # in order of preference
+
+SCRIPT_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.I | re.S)
+TAG_RE = re.compile(r"<!--.*?-->|<[^>]*>", re.S)
+IMG_SRC_RE = re.compile(r"""<img\b[^>]*?\ssrc\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""", re.I)
+
+
+def _empty_item():
+    return {
+        "title": None,
+        "link": None,
+        "pubDate": None,
+        "description": None,
+        "enclosure_url": None,
+        "enclosure_type": None,
+        "media_thumbnail": None,
+        "media_content": None,
+    }
+
+
+def _read_item(elem, QName):
+    item = _empty_item()
+    item_ns = QName(elem).namespace
+    for child in elem.iter():
+        if child is elem or not isinstance(child.tag, str):
+            continue
+        qname = QName(child)
+        name = qname.localname
+        if qname.namespace == MEDIA_NS:
+            if name == "thumbnail" and item["media_thumbnail"] is None:
+                item["media_thumbnail"] = child.get("url")
+            elif name == "content" and item["media_content"] is None:
+                item["media_content"] = child.get("url")
+        elif name == "enclosure" and item["enclosure_url"] is None:
+            item["enclosure_url"] = child.get("url")
+            item["enclosure_type"] = child.get("type", "")
+        elif name in TEXT_FIELDS and qname.namespace == item_ns and item[name] is None:
+            item[name] = "".join(child.itertext())
+    return item
+
+
+def iter_items(rss_content):
+    """Stream the <item> elements of a feed as plain dicts of raw fields.
+
+    Each element is cleared once read, so peak memory stays around one item
+    instead of the whole document tree. Raises ``etree.XMLSyntaxError`` on
+    malformed input.
+    """
+    from lxml import etree
+
+    context = etree.iterparse(
+        io.BytesIO(rss_content), events=("end",), tag="{*}item",
+        resolve_entities=False, no_network=True,
+    )
+    for _, elem in context:
+        yield _read_item(elem, etree.QName)
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+def iter_items_soup(rss_content):
+    """Fallback for feeds lxml rejects: BeautifulSoup's forgiving XML parser."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(rss_content, "xml")
+    for node in soup.find_all("item"):
+        item = _empty_item()
+        for name in TEXT_FIELDS:
+            child = node.find(name)
+            if child is not None:
+                item[name] = child.text
+        enclosure = node.find("enclosure")
+        if enclosure:
+            item["enclosure_url"] = enclosure.get("url")
+            item["enclosure_type"] = enclosure.get("type", "")
+        media_thumbnail = node.find("media:thumbnail")
+        if media_thumbnail:
+            item["media_thumbnail"] = media_thumbnail.get("url")
+        media_content = node.find("media:content")
+        if media_content:
+            item["media_content"] = media_content.get("url")
+        yield item
+
+
+def description_text(desc_raw):
+    return html.unescape(TAG_RE.sub("", SCRIPT_RE.sub("", desc_raw))).strip()
+
+
+def description_image(desc_raw):
+    match = IMG_SRC_RE.search(desc_raw)
+    if not match:
+        return None
+    return html.unescape(next(g for g in match.groups() if g is not None)) or None
+
+
+def clean_description(desc_raw):
+    """Return (plain text, first <img> src) of an HTML description."""
+    return description_text(desc_raw), description_image(desc_raw)
+
+
+def item_image(item, desc_img_url):
+    """Return (source, url) of an item's image, trying IMAGE_SOURCES in order; (None, None) without one."""
+    enclosure = item["enclosure_url"] if item["enclosure_type"] and item["enclosure_type"].startswith("image") else None
+    for source, url in zip(IMAGE_SOURCES, (enclosure, item["media_thumbnail"], item["media_content"], desc_img_url)):
+        if url:
+            return source, url
+    return None, None
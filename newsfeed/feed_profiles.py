@@ -0,0 +1,138 @@
+import html
+import json
+import os
+from urllib.parse import urlsplit
+
+from .feed_parser import clean_description, description_text, item_image
+from .output import atomic_write
+from .persian_date import TEHRAN, format_persian_datetime, read_pub_date
+
+PROFILE_PATH = os.path.join(".cache", "feed-profiles.json")
+PROFILE_VERSION = 1
+TRAITS = ("date", "utc_offset", "html", "image")
+LEARN_MIN_ITEMS = 5  # generically parsed items a profile is learned from
+MISS_LIMIT = 0.2     # a profile missing more than this share of a feed's items is dropped and re-learned
+FIELD_IMAGES = frozenset({"enclosure", "media_thumbnail", "media_content"})
+
+
+class FeedProfile:
+    """What one source's items look like, and a direct extraction path for them.
+
+    ``traits`` maps each of TRAITS to the value every item agreed on, or None
+    where items differed (that part then always takes the generic chain):
+
+    * ``date`` and ``utc_offset`` -- the parser that reads its pubDates
+      (see persian_date.read_pub_date) and the zone they are written in, in
+      minutes; both are checked on every item, so a change of date layout is
+      noticed;
+    * ``html`` -- whether descriptions carry markup; plain-text ones skip
+      tag stripping and the <img> search;
+    * ``image`` -- the field its image comes from (one of IMAGE_SOURCES, or
+      "none"); with a feed field the description is never searched for <img>.
+
+    ``extract`` checks every assumption it relies on and returns None on the
+    first that fails, so the item goes through the generic chain and the
+    result is the same either way; a profile that keeps missing is dropped
+    and learned again.
+    """
+
+    def __init__(self, traits=None):
+        self.traits = traits
+        self.reset()
+
+    def reset(self):
+        self.hits = self.misses = 0
+        self.observed = []
+        self.outcome = None
+
+    def extract(self, item):
+        """Return (gregorian, date text, desc text, image url), or None when the item doesn't fit."""
+        traits = self.traits
+        if traits is None:
+            return None
+        try:
+            dt, date_format = read_pub_date(item["pubDate"].strip())
+        except Exception:
+            dt = date_format = None
+        if (dt is None or traits["date"] not in (None, date_format)
+                or traits["utc_offset"] not in (None, dt.utcoffset().total_seconds() // 60)):
+            self.misses += 1
+            return None
+
+        desc_raw = item["description"].strip()
+        if traits["html"] is False:
+            if "<" in desc_raw:
+                self.misses += 1
+                return None
+            desc_text, desc_img_url = html.unescape(desc_raw).strip(), None
+        elif traits["image"] in FIELD_IMAGES:
+            desc_text, desc_img_url = description_text(desc_raw), None
+        else:
+            desc_text, desc_img_url = clean_description(desc_raw)
+
+        image_source, img_url = item_image(item, desc_img_url)
+        if traits["image"] is not None and (image_source or "none") != traits["image"]:
+            self.misses += 1
+            return None
+        self.hits += 1
+        dt_tehran = dt.astimezone(TEHRAN)
+        return dt_tehran, format_persian_datetime(dt_tehran), desc_text, img_url
+
+    def observe(self, traits):
+        """Record the traits of an item that went through the generic chain."""
+        self.observed.append(traits)
+
+    def finish(self):
+        """Settle the profile after a feed: drop it if it missed too often, or learn one."""
+        if self.traits is not None:
+            if self.misses > MISS_LIMIT * (self.hits + self.misses):
+                self.traits = None
+                self.outcome = "dropped"
+        elif len(self.observed) >= LEARN_MIN_ITEMS:
+            traits = {name: self.observed[0][name] for name in TRAITS}
+            for observed in self.observed[1:]:
+                for name in TRAITS:
+                    if observed[name] != traits[name]:
+                        traits[name] = None
+            if any(value is not None for value in traits.values()):
+                self.traits = traits
+                self.outcome = "learned"
+
+
+class FeedProfiles:
+    """Learned FeedProfile traits per source host, kept in ``.cache`` between runs."""
+
+    def __init__(self, path=PROFILE_PATH):
+        self.path = path
+        self.hosts = {}
+        self.counts = {"hits": 0, "misses": 0, "learned": 0, "dropped": 0}
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == PROFILE_VERSION:
+                self.hosts = data["hosts"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def get(self, url):
+        return FeedProfile(self.hosts.get(urlsplit(url).hostname))
+
+    def update(self, url, profile):
+        """Take back a profile after its feed was parsed (possibly in another process)."""
+        host = urlsplit(url).hostname
+        if profile.outcome == "dropped":
+            self.hosts.pop(host, None)
+        elif profile.traits is not None:
+            self.hosts[host] = profile.traits
+        self.counts["hits"] += profile.hits
+        self.counts["misses"] += profile.misses
+        if profile.outcome:
+            self.counts[profile.outcome] += 1
+
+    def save(self):
+        atomic_write(self.path, json.dumps({"version": PROFILE_VERSION, "hosts": self.hosts}, indent=1, sort_keys=True))
+
+    def summary(self):
+        c = self.counts
+        return (f"🧬 Feed profiles: {len(self.hosts)} hosts, {c['hits']} items via profile, {c['misses']} misses, "
+                f"{c['learned']} learned, {c['dropped']} dropped")
@@ -0,0 +1,90 @@
+import json
+import os
+import random
+import threading
+import time
+
+BREAKER_PATH = os.path.join(".cache", "circuit-breakers.json")
+CRAWL_DEADLINE = 60      # seconds for the whole fetch phase of a crawl
+MAX_ATTEMPTS = 3         # per feed, including the first request
+BACKOFF_BASE = 0.5       # seconds; doubled per retry, then fully jittered
+BACKOFF_MAX = 4
+FAILURE_THRESHOLD = 4    # consecutive failed requests to one host open its circuit
+COOLDOWN = 30 * 60       # seconds an open circuit stays open, across runs too
+RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+class DeadlineExceeded(Exception):
+    pass
+
+
+class CircuitOpen(Exception):
+    pass
+
+
+class Deadline:
+    def __init__(self, seconds=CRAWL_DEADLINE):
+        self.end = time.monotonic() + seconds
+
+    def remaining(self):
+        return max(self.end - time.monotonic(), 0.0)
+
+    def check(self, url):
+        if not self.remaining():
+            raise DeadlineExceeded(f"crawl deadline reached before {url} was fetched")
+
+
+def backoff_delay(attempt):
+    """Full-jitter exponential backoff: uniform in [0, BACKOFF_BASE * 2**attempt], capped."""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt))
+
+
+class CircuitBreaker:
+    """Per-host consecutive failure counts; a host that keeps failing is skipped.
+
+    After FAILURE_THRESHOLD failed requests in a row a host's circuit opens and
+    every request to it fails fast with CircuitOpen until the cool-down has
+    passed. Open circuits are written to ``path`` so later runs (and a
+    restarted daemon) keep skipping the host; without a path the state lives
+    only as long as the object.
+    """
+
+    def __init__(self, path=BREAKER_PATH, threshold=FAILURE_THRESHOLD, cooldown=COOLDOWN):
+        self.path = path
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = {}
+        self.open_until = {}  # host -> epoch seconds
+        self.lock = threading.Lock()
+        if path:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    self.open_until = {host: until for host, until in json.load(f).items() if until > time.time()}
+            except (OSError, ValueError):
+                pass
+
+    def check(self, host):
+        until = self.open_until.get(host)
+        if until and until > time.time():
+            raise CircuitOpen(f"{host} is failing; skipped until {time.strftime('%H:%M', time.localtime(until))}")
+
+    def success(self, host):
+        with self.lock:
+            self.failures.pop(host, None)
+            self.open_until.pop(host, None)
+
+    def failure(self, host):
+        with self.lock:
+            self.failures[host] = self.failures.get(host, 0) + 1
+            # An expired cool-down counts as closed, so a host that is still failing opens again
+            if self.failures[host] >= self.threshold and self.open_until.get(host, 0) <= time.time():
+                self.open_until[host] = time.time() + self.cooldown
+                print(f"🔌 Circuit open for {host} after {self.failures[host]} failures, cooling down {self.cooldown // 60:.0f} min")
+
+    def save(self):
+        if not self.path:
+            return
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        now = time.time()
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({host: until for host, until in self.open_until.items() if until > now}, f)
@@ -0,0 +1,113 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from urllib.parse import urlsplit
+
+from .fetch_policy import (
+    MAX_ATTEMPTS, RETRY_STATUS, CircuitBreaker, Deadline, DeadlineExceeded, backoff_delay,
+)
+from .run_report import RunReport
+
+FETCH_TIMEOUT = 10
+FETCH_WORKERS = 16
+PER_HOST_LIMIT = 4  # most feeds live on a handful of hosts (irna, hamshahri, eghtesadonline)
+
+# requests (with urllib3 and certifi under it) is the slowest import in the
+# crawler, so it is only loaded once something is actually fetched.
+def make_session():
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=FETCH_WORKERS, pool_maxsize=PER_HOST_LIMIT)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def fetch_rss_content(url, session=None, headers=None, timeout=FETCH_TIMEOUT):
+    if session is None:
+        import requests
+        session = requests
+    return session.get(url, headers=headers, timeout=timeout)
+
+def fetch_feeds(urls, cache=None, report=None, deadline=None, breaker=None):
+    """Fetch all urls in parallel and yield (url, response, error) in the given order.
+
+    Requests are conditional on the validators stored in ``cache``, so an
+    unchanged feed comes back as an empty 304 (without a cache every request is
+    unconditional). Per-feed timings go to ``report``:
+    ``ttfb_s`` is requests' ``elapsed`` (DNS, connect and TLS on a fresh
+    connection, plus the wait for headers), ``download_s`` the body transfer.
+
+    Connection errors, timeouts and 429/5xx answers are retried with jittered
+    backoff; every failed request counts against its host in ``breaker``, and
+    hosts with an open circuit are not contacted at all. Nothing runs past
+    ``deadline``: feeds still outstanding then fail with DeadlineExceeded.
+    """
+    import requests
+
+    report = report if report is not None else RunReport()
+    deadline = deadline if deadline is not None else Deadline()
+    breaker = breaker if breaker is not None else CircuitBreaker(path=None)
+    session = make_session()
+    host_slots = {urlsplit(url).hostname: threading.BoundedSemaphore(PER_HOST_LIMIT) for url in urls}
+    started = time.perf_counter()
+    finished = [started]
+
+    def fetch_once(url, host):
+        queued = time.perf_counter()
+        with host_slots[host]:
+            deadline.check(url)
+            breaker.check(host)
+            start = time.perf_counter()
+            try:
+                response = fetch_rss_content(url, session, cache.validators(url) if cache else None,
+                                             timeout=min(FETCH_TIMEOUT, deadline.remaining()))
+            finally:
+                end = time.perf_counter()
+                finished.append(end)
+        ttfb = response.elapsed.total_seconds()
+        report.feed(
+            url, status=response.status_code, bytes=len(response.content), wait_s=round(start - queued, 4),
+            fetch_s=round(end - start, 4), ttfb_s=round(ttfb, 4), download_s=round(max(end - start - ttfb, 0), 4),
+        )
+        return response
+
+    def fetch_one(url):
+        host = urlsplit(url).hostname
+        for attempt in range(MAX_ATTEMPTS):
+            report.feed(url, attempts=attempt + 1)
+            try:
+                response = fetch_once(url, host)
+                if response.status_code not in RETRY_STATUS:
+                    breaker.success(host)  # the host answered; a 404 is the feed's problem, not the host's
+                    response.raise_for_status()
+                    return response
+                response.raise_for_status()
+            except (requests.ConnectionError, requests.Timeout, requests.HTTPError) as e:
+                if isinstance(e, requests.HTTPError) and e.response.status_code not in RETRY_STATUS:
+                    raise
+                breaker.failure(host)
+                if attempt + 1 == MAX_ATTEMPTS:
+                    raise
+                time.sleep(min(backoff_delay(attempt), deadline.remaining()))
+
+    for url in urls:
+        report.feed(url)  # keep the report in feed order
+
+    pool = ThreadPoolExecutor(max_workers=FETCH_WORKERS)
+    try:
+        futures = [(url, pool.submit(fetch_one, url)) for url in urls]
+        for url, future in futures:
+            try:
+                yield url, future.result(timeout=deadline.remaining()), None
+            except FutureTimeout:
+                yield url, None, DeadlineExceeded(f"crawl deadline reached while fetching {url}")
+            except Exception as e:
+                yield url, None, e
+    finally:
+        # Requests still running past the deadline are abandoned, not waited for
+        pool.shutdown(wait=False, cancel_futures=True)
+        session.close()
+        breaker.save()
+    report.add_time("fetch", max(finished) - started)
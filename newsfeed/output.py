@@ -0,0 +1,56 @@
+import hashlib
+import os
+import threading
+from contextlib import contextmanager
+
+
+@contextmanager
+def atomic_file(path):
+    """Open a binary temp file next to ``path`` that replaces it when the block ends without error.
+
+    The temp file sits next to the target, so the rename is atomic and a
+    reader (web server, git, the browser) sees either the old file or the new
+    one, never a partial write. Each call gets its own temp name, so threads
+    writing the same path don't trip over each other's temp file.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.{os.urandom(4).hex()}.tmp"
+    try:
+        # O_EXCL: never reuse another writer's temp file; mode 0o666 leaves the permissions to the umask
+        with open(os.open(tmp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666), "wb") as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def atomic_write(path, data):
+    """Write ``data`` (str or bytes) to ``path`` through atomic_file."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    with atomic_file(path) as f:
+        f.write(data)
+
+
+def write_if_changed(path, data):
+    """atomic_write unless ``path`` already holds exactly ``data``; returns whether it wrote."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    atomic_write(path, data)
+    return True
+
+
+def content_hash(*parts):
+    """Short SHA-256 of the parts (str, or bytes already encoded) in order."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else part.encode("utf-8"))
+    return digest.hexdigest()[:16]
@@ -0,0 +1,61 @@
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .article_store import normalize_link
+from .parsing import parse_feed
+
+_known = None  # per worker process, set by _init_worker
+
+
+class KnownArticles:
+    """Read-only stand-in for ArticleStore.get inside worker processes."""
+
+    def __init__(self, articles):
+        self.articles = articles
+
+    def get(self, link):
+        return self.articles.get(normalize_link(link))
+
+
+def _init_worker(known):
+    global _known
+    _known = KnownArticles(known)
+
+
+def _parse(rss_content, profile):
+    start = time.perf_counter()
+    articles, failed = parse_feed(rss_content, _known, profile)
+    return articles, failed, time.perf_counter() - start, profile
+
+
+class ParsePool:
+    """Parses raw feed bodies in worker processes.
+
+    Workers get the stored articles once, through the pool initializer, so
+    known items still skip date and description work. ``submit`` returns a
+    future of (articles, failed items, parse seconds, the feed's updated
+    FeedProfile or None); Article is a plain tuple, so results pickle
+    compactly. The caller merges feeds in its own order, so cross-feed dedup
+    is unaffected by which worker finishes first. Workers are started with
+    forkserver (spawn where that is missing), since the parent is running
+    fetch threads when the first feed comes in.
+    """
+
+    def __init__(self, workers, store=None):
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        known = store.snapshot() if store else {}
+        self.pool = ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker, initargs=(known,))
+
+    def submit(self, rss_content, profile=None):
+        return self.pool.submit(_parse, rss_content, profile)
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,77 @@
+from .article import Article
+from .feed_parser import clean_description, item_image, iter_items, iter_items_soup
+from .persian_date import TEHRAN, format_persian_datetime, read_pub_date
+
+def extract_fields(item):
+    """The generic extraction chain: ((gregorian, date text, desc text, image url), traits).
+
+    ``traits`` records which date parser, description kind and image source
+    the item turned out to use, for feed_profiles.FeedProfile to learn from.
+    """
+    pub_date = item["pubDate"].strip()
+    try:
+        dt, date_format = read_pub_date(pub_date)
+        utc_offset = int(dt.utcoffset().total_seconds() // 60)
+        dt_tehran = dt.astimezone(TEHRAN)
+        pub_date_formatted = format_persian_datetime(dt_tehran)
+    except Exception as e:
+        print(f"⚠️ Error parsing date: {e}")
+        pub_date_formatted = pub_date
+        dt_tehran = date_format = utc_offset = None  # Fallback
+
+    desc_raw = item["description"].strip()
+    desc_text, desc_img_url = clean_description(desc_raw)
+
+    # enclosure, then media:thumbnail or media:content, then <img> inside <description>
+    image_source, img_url = item_image(item, desc_img_url)
+
+    traits = {"date": date_format, "utc_offset": utc_offset, "html": "<" in desc_raw, "image": image_source or "none"}
+    return (dt_tehran, pub_date_formatted, desc_text, img_url), traits
+
+def parse_item(item, store=None, profile=None):
+    title = item["title"].strip()
+    link = item["link"].strip()
+
+    # Articles processed in an earlier run keep their derived fields
+    stored = store.get(link) if store else None
+    if stored:
+        return Article.new(title, link, stored.desc, stored.date, stored.image, stored.gregorian)
+
+    # The source's learned layout gives a shortcut; anything unexpected takes the generic chain
+    fields = profile.extract(item) if profile is not None else None
+    if fields is None:
+        fields, traits = extract_fields(item)
+        if profile is not None:
+            profile.observe(traits)
+    dt_tehran, pub_date_formatted, desc_text, img_url = fields
+    return Article.new(title, link, desc_text, pub_date_formatted, img_url, dt_tehran)
+
+def parse_items(items, store=None, profile=None):
+    """Return (articles, number of items that could not be parsed)."""
+    articles = []
+    failed = 0
+    for item in items:
+        try:
+            articles.append(parse_item(item, store, profile))
+        except Exception:
+            failed += 1
+    return articles, failed
+
+def parse_feed(rss_content, store=None, profile=None):
+    """Parse raw RSS bytes into (articles, number of items that failed).
+
+    With a feed_profiles.FeedProfile, items are extracted through it and it
+    is updated with what this feed looked like.
+    """
+    from lxml import etree
+
+    try:
+        result = parse_items(iter_items(rss_content), store, profile)
+    except etree.XMLSyntaxError:
+        # Malformed feed: retry with BeautifulSoup's more forgiving parser
+        if profile is not None:
+            profile.reset()
+        result = parse_items(iter_items_soup(rss_content), store, profile)
+    if profile is not None:
+        profile.finish()
+    return result
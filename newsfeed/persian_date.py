@@ -0,0 +1,126 @@
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+TEHRAN = ZoneInfo("Asia/Tehran")
+GMT = timezone.utc
+
+# --- Mappings ---
+PERSIAN_WEEKDAYS = {
+    "Saturday": "شنبه",
+    "Sunday": "یک‌شنبه",
+    "Monday": "دوشنبه",
+    "Tuesday": "سه‌شنبه",
+    "Wednesday": "چهارشنبه",
+    "Thursday": "پنج‌شنبه",
+    "Friday": "جمعه"
+}
+
+PERSIAN_MONTHS = {
+    "Farvardin": "فروردین",
+    "Ordibehesht": "اردیبهشت",
+    "Khordad": "خرداد",
+    "Tir": "تیر",
+    "Mordad": "مرداد",
+    "Shahrivar": "شهریور",
+    "Mehr": "مهر",
+    "Aban": "آبان",
+    "Azar": "آذر",
+    "Dey": "دی",
+    "Bahman": "بهمن",
+    "Esfand": "اسفند"
+}
+
+# jdatetime weeks start on Saturday (weekday() == 0) and months are 1-based
+WEEKDAYS_BY_INDEX = tuple(PERSIAN_WEEKDAYS.values())
+MONTHS_BY_INDEX = tuple(PERSIAN_MONTHS.values())
+
+PERSIAN_DIGITS = str.maketrans("0123456789", "۰۱۲۳۴۵۶۷۸۹")
+
+def to_persian_digits(s):
+    return s.translate(PERSIAN_DIGITS)
+
+# --- Parsing ---
+RFC822_RE = re.compile(
+    r"(?:[A-Za-z]{3},\s*)?(\d{1,2})\s+([A-Za-z]{3})\s+(\d{4})\s+"
+    r"(\d{1,2}):(\d{2})(?::(\d{2}))?\s*(?:([+-])(\d{2})(\d{2})|([A-Z]{1,3}))?$"
+)
+
+MONTH_NUMBERS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12
+}
+
+ZONE_OFFSETS = {
+    "GMT": GMT, "UT": GMT, "UTC": GMT, "Z": GMT,
+    "EST": timezone(timedelta(hours=-5)), "EDT": timezone(timedelta(hours=-4)),
+    "CST": timezone(timedelta(hours=-6)), "CDT": timezone(timedelta(hours=-5)),
+    "MST": timezone(timedelta(hours=-7)), "MDT": timezone(timedelta(hours=-6)),
+    "PST": timezone(timedelta(hours=-8)), "PDT": timezone(timedelta(hours=-7))
+}
+
+@lru_cache(maxsize=64)
+def _fixed_offset(sign, hours, minutes):
+    offset = timedelta(hours=int(hours), minutes=int(minutes))
+    return timezone(-offset if sign == "-" else offset)
+
+def _parse_rfc822(pub_date):
+    match = RFC822_RE.match(pub_date)
+    if not match:
+        return None
+    day, month, year, hour, minute, second, sign, off_h, off_m, zone = match.groups()
+    if month not in MONTH_NUMBERS:
+        return None
+    if sign:
+        tz = _fixed_offset(sign, off_h, off_m)
+    elif zone:
+        tz = ZONE_OFFSETS.get(zone)
+        if tz is None:
+            return None
+    else:
+        tz = GMT
+    return datetime(int(year), MONTH_NUMBERS[month], int(day), int(hour), int(minute), int(second or 0), tzinfo=tz)
+
+def _parse_dateutil(pub_date):
+    from dateutil import parser
+
+    dt = parser.parse(pub_date)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=GMT)
+    return dt
+
+def read_pub_date(pub_date):
+    """Return (aware datetime in the feed's own zone, "rfc822" or "dateutil" for the parser that read it)."""
+    dt = _parse_rfc822(pub_date)
+    if dt is not None:
+        return dt, "rfc822"
+    return _parse_dateutil(pub_date), "dateutil"
+
+def parse_pub_date(pub_date):
+    """Parse an RSS pubDate into an aware datetime in Tehran time.
+
+    Well-formed RFC-822 dates (what nearly every feed sends) are handled by a
+    strict regex; anything else goes through dateutil. Dates without a
+    timezone are assumed to be GMT.
+    """
+    return read_pub_date(pub_date)[0].astimezone(TEHRAN)
+
+# --- Formatting ---
+@lru_cache(maxsize=4096)
+def _format_minute(epoch_minute):
+    import jdatetime
+
+    jd = jdatetime.datetime.fromgregorian(datetime=datetime.fromtimestamp(epoch_minute * 60, TEHRAN))
+    day = to_persian_digits(f"{jd.day:02d}")
+    year = to_persian_digits(f"{jd.year:04d}")
+    time_str = to_persian_digits(f"{jd.hour:02d}:{jd.minute:02d}")
+    return f"{WEEKDAYS_BY_INDEX[jd.weekday()]}، {day} {MONTHS_BY_INDEX[jd.month - 1]} {year} ⏰ {time_str}"
+
+def format_persian_datetime(dt):
+    """Format an aware datetime as e.g. 'شنبه، ۳۱ مرداد ۱۴۰۵ ⏰ ۲۲:۱۰' (Tehran time).
+
+    Results are memoized per minute, since a run formats many items that
+    share a publication minute.
+    """
+    return _format_minute(int(dt.timestamp() // 60))
@@ -0,0 +1,33 @@
+import re
+import unicodedata
+
+# Arabic code points that Persian text uses interchangeably with the Persian ones
+CHAR_MAP = str.maketrans({
+    "ي": "ی", "ى": "ی", "ئ": "ی",
+    "ك": "ک",
+    "ة": "ه", "ۀ": "ه",
+    "أ": "ا", "إ": "ا", "ٱ": "ا",
+    "ؤ": "و",
+    "\u200c": "",  # ZWNJ: "می‌شود" and "میشود" are the same word
+    "\u200d": "",  # ZWJ
+    "ـ": "",       # tatweel
+    **{d: str(i) for i, d in enumerate("۰۱۲۳۴۵۶۷۸۹")},
+    **{d: str(i) for i, d in enumerate("٠١٢٣٤٥٦٧٨٩")},
+})
+
+WORD_RE = re.compile(r"\w+")
+
+
+def normalize_persian(text):
+    """Fold spelling variants so the same Persian text compares equal.
+
+    Unifies Arabic/Persian yeh and kaf, drops diacritics, ZWNJ and tatweel,
+    and maps Persian/Arabic digits to ASCII.
+    """
+    text = (text or "").translate(CHAR_MAP)
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return text.lower()
+
+
+def tokenize(text):
+    return WORD_RE.findall(normalize_persian(text))
@@ -0,0 +1,209 @@
+import itertools
+import os
+import time
+from collections import defaultdict
+from datetime import datetime
+
+from .article import merge_newest, sort_newest
+from .article_store import ArticleStore, normalize_link
+from .clustering import cluster_articles
+from .compress import STATIC_FILES, Compressor
+from .feed_cache import FeedCache
+from .feed_profiles import FeedProfiles
+from .fetch_policy import CRAWL_DEADLINE, CircuitBreaker, Deadline
+from .fetching import fetch_feeds
+from .parse_pool import ParsePool
+from .parsing import parse_feed
+from .persian_date import TEHRAN, format_persian_datetime
+from .renderer import render_pages
+from .run_report import REPORT_PATH, RunReport
+from .search_index import SearchIndex
+from .sources import feeds as FEEDS
+from .thumbnails import ThumbnailCache
+
+# --- Output ---
+MAX_PER_CATEGORY = 2000  # newest articles kept per category; bounds memory as the store's history grows
+JSON_MODE = False  # True: articles past the per-category limit load from <page>.json on scroll instead of archive pages
+
+# --- Pipeline ---
+def load_feed(url, response, cache, store, report, profiles=None):
+    """Return the parsed articles of one fetched feed (from ``cache`` on a 304)."""
+    articles = cache.items(url) if response.status_code == 304 else None
+    if articles is None:
+        start = time.perf_counter()
+        profile = profiles.get(url) if profiles is not None else None
+        articles, failed = parse_feed(response.content, store, profile)
+        parse_time = time.perf_counter() - start
+        if profiles is not None:
+            profiles.update(url, profile)
+        report.add_time("parse", parse_time)
+        report.feed(url, parse_s=round(parse_time, 4), item_errors=failed)
+        cache.store(url, response, articles)
+    return articles
+
+def merge_articles(feed_list, feed_articles, store, report, limit=MAX_PER_CATEGORY, deltas=None):
+    """Combine per-feed article lists into {category: [article, ...]}, newest first.
+
+    Articles are deduplicated across feeds in ``feed_list`` order and merged
+    with retained articles from the store. Each feed becomes one newest-first
+    stream and a category is a k-way merge of its streams, cut at ``limit``.
+    Articles the store had not seen before are passed to ``deltas`` as they
+    are saved.
+    """
+    seen_links = set()
+    streams = defaultdict(list)
+    for category, source, url in feed_list:
+        articles = feed_articles.get(url)
+        if articles is None:
+            continue
+        current = []
+        for article in articles:
+            key = normalize_link(article.link)
+            if key in seen_links:
+                continue
+            seen_links.add(key)
+            article, new = store.save(category, article._replace(source=source))
+            current.append(article)
+            if new and deltas is not None:
+                deltas.add(category, article)
+        streams[category].append(sort_newest(current))
+        report.feed(url, items=len(articles), new=len(current), duplicates=len(articles) - len(current))
+
+    # Stored articles that have dropped out of their feeds but are still retained form one more stream
+    category_articles = {}
+    with report.stage("merge"):
+        for category in dict.fromkeys(category for category, _, _ in feed_list):
+            history = store.history(category, exclude=seen_links)
+            # History is newest first, so reading at most `limit` rows loses nothing
+            streams[category].append(list(itertools.islice(history, limit)))
+            history.close()
+            merged = merge_newest(streams[category], limit)
+            if merged:
+                category_articles[category] = merged
+        print(f"🗃️ Article store: {len(seen_links)} current, {store.evict()} evicted")
+    return category_articles
+
+def feed_entries(feeds):
+    return [(category, source, url) for category, sources in feeds.items() for source, url in sources.items()]
+
+def collect(feeds=FEEDS, cache=None, store=None, report=None, deadline=None, parse_workers=0, deltas=None,
+            profiles=None):
+    """Fetch and parse every feed and return {category: [article, ...]}.
+
+    ``feeds`` maps category -> {source name: url}. Without a ``store`` one is
+    opened at the default path for the duration of the call. Fetching stops
+    after ``deadline`` seconds (CRAWL_DEADLINE by default); feeds that fail
+    fall back to their last cached articles. With ``parse_workers`` > 1 feed
+    bodies are parsed in that many worker processes while fetching goes on.
+    New articles are logged to ``deltas`` (see delta_feeds.DeltaFeeds).
+    Items are extracted through each source's learned profile (see
+    feed_profiles.FeedProfiles, loaded from ``.cache`` by default).
+    """
+    if store is None:
+        store = ArticleStore()
+        try:
+            return collect(feeds, cache, store, report, deadline, parse_workers, deltas, profiles)
+        finally:
+            store.close()
+    cache = cache if cache is not None else FeedCache()
+    profiles = profiles if profiles is not None else FeedProfiles()
+    report = report if report is not None else RunReport()
+
+    feed_list = feed_entries(feeds)
+    fetched = fetch_feeds([url for _, _, url in feed_list], cache, report,
+                          Deadline(deadline or CRAWL_DEADLINE), CircuitBreaker())
+
+    # Feeds are downloaded concurrently but consumed here in the original order,
+    # so dedup in merge_articles (and therefore the output) stays deterministic.
+    feed_articles = {}
+    pool = ParsePool(parse_workers, store) if parse_workers > 1 else None
+    parsing = {}  # url -> (response, future) for feeds handed to the pool
+    try:
+        for (_, response, fetch_error), (category, source, url) in zip(fetched, feed_list):
+            print(f"📥 Reading from: {source} -> {url}")
+            if fetch_error is not None:
+                report.error(url, "fetch", fetch_error)
+                articles = cache.fallback(url)
+                if articles is not None:
+                    feed_articles[url] = articles  # last good copy, so a failing host doesn't empty the page
+                    report.feed(url, stale=True)
+                continue
+            try:
+                if pool is not None and response.status_code != 304:
+                    parsing[url] = (response, pool.submit(response.content, profiles.get(url)))
+                else:
+                    feed_articles[url] = load_feed(url, response, cache, store, report, profiles)
+            except Exception as e:
+                report.error(url, "parse", e)
+
+        # Only the wait for workers still busy after the last fetch counts as parse time here
+        with report.stage("parse"):
+            for url, (response, future) in parsing.items():
+                try:
+                    articles, failed, parse_time, profile = future.result()
+                except Exception as e:
+                    report.error(url, "parse", e)
+                    continue
+                profiles.update(url, profile)
+                report.feed(url, parse_s=round(parse_time, 4), item_errors=failed)
+                cache.store(url, response, articles)
+                feed_articles[url] = articles
+    finally:
+        if pool is not None:
+            pool.close()
+
+    print(cache.summary())
+    print(profiles.summary())
+    profiles.save()
+    return merge_articles(feed_list, feed_articles, store, report, deltas=deltas)
+
+def render(category_articles, report=None, json_mode=None, fragments=False, compress=True, thumbnails=False,
+           deltas=None):
+    """Cluster, index and render collected (newest-first) articles.
+
+    ``json_mode`` (JSON_MODE when None) sends articles past each category's
+    limit to <page>.json instead of archive pages; see renderer.render_pages.
+    ``deltas`` publishes the per-category JSON Feeds and this run's changes.
+    With ``thumbnails`` article images are replaced by local thumbnails (see
+    thumbnails.ThumbnailCache). With ``compress`` every output also gets
+    .gz/.br siblings and an entry in manifest.json; see compress.Compressor.
+    """
+    report = report if report is not None else RunReport()
+    json_mode = JSON_MODE if json_mode is None else json_mode
+    compressor = Compressor() if compress else None
+
+    # Collapse the same story reported by several sources into one card
+    with report.stage("cluster"):
+        article_count = sum(len(articles) for articles in category_articles.values())
+        category_articles = {category: cluster_articles(articles) for category, articles in category_articles.items()}
+        print(f"🧩 Clustering: {article_count - sum(len(a) for a in category_articles.values())} near-duplicates merged")
+
+    if deltas is not None:
+        with report.stage("deltas"):
+            api_files = deltas.publish(category_articles)
+        if compressor is not None:
+            for path in api_files:
+                compressor.submit(path)
+
+    if thumbnails:
+        with report.stage("thumbnails"):
+            category_articles = ThumbnailCache().apply(category_articles)
+
+    with report.stage("index"):
+        index = SearchIndex()
+        index.update(category_articles)
+    if compressor is not None:
+        for path in index.files() + [path for path in STATIC_FILES if os.path.exists(path)]:
+            compressor.submit(path)
+
+    render_pages(category_articles, format_persian_datetime(datetime.now(TEHRAN)), json_mode=json_mode, report=report,
+                 fragments=fragments, compressor=compressor)
+    if compressor is not None:
+        with report.stage("compress"):
+            compressor.finish()
+
+def write_report(report, path=REPORT_PATH, prometheus=None):
+    report.write_json(path)
+    if prometheus:
+        report.write_prometheus(prometheus)
+    print(report.summary())
@@ -0,0 +1,594 @@
+import hashlib
+import html
+import json
+import os
+import re
+from collections import namedtuple
+from contextlib import nullcontext
+from string import Template
+
+from .output import atomic_file, content_hash, write_if_changed
+from .thumbnails import THUMB_DIR
+
+# --- Templates ---
+LAST_UPDATED_TEMPLATE = Template("""
+<div style="text-align:center; font-size: 16px; color: #666; margin-bottom: 16px;">
+    بروزرسانی اخیر: $updated_at
+</div>
+""")
+
+DESKTOP_TEMPLATE = Template("""
+<!DOCTYPE html>
+<html lang="fa" dir="rtl">
+<head>
+    <meta charset="UTF-8">
+    <meta name="content-hash" content="$content_hash">
+    <title>اخبار گزیده روز</title>
+    <style>
+        html, body {
+            margin: 0;
+            padding: 0;
+            font-family: 'Segoe UI', sans-serif;
+            background: #f2f2f2;
+            direction: rtl;
+            overflow-x: hidden; 
+            overflow-y: auto;    
+        }
+
+        h1 {
+            text-align: center;
+            color: #003366;
+            font-size: 32px;
+            margin-bottom: 40px;
+        }
+
+        .container {
+            padding-left: 30px;
+            padding-right: 30px;
+            padding-bottom: 40px;
+            box-sizing: border-box;
+            height: 100%%; /* match full height for internal layout */
+        }
+    
+        .grid {
+            display: grid;
+            grid-template-columns: repeat(4, 1fr);
+            gap: 24px;
+            height: calc(100vh - 200px); 
+            overflow: hidden; 
+        }
+    
+        .category {
+            background: #fff;
+            border-radius: 10px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.05);
+            display: flex;
+            flex-direction: column;
+            position: relative;
+            overflow-y: auto;
+        }
+    
+        .category-title {
+            background-color: #003366;
+            color: white;
+            font-size: 22px;
+            font-weight: bold;
+            padding: 14px 10px;
+            text-align: center;
+            position: sticky;
+            top: 0;
+            z-index: 10;
+            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+        }
+    
+        .article {
+            border-bottom: 1px solid #ddd;
+            padding: 14px 10px;
+            background-color: #fafafa;
+            border-radius: 4px;
+            margin: 10px;
+        }
+    
+        .article img {
+            width: 100%%;
+            max-height: 160px;
+            object-fit: cover;
+            border-radius: 5px;
+            margin-bottom: 10px;
+        }
+    
+        .title {
+            font-size: 18px;
+            font-weight: 700;
+            color: #0056b3;
+            text-decoration: none;
+            display: block;
+            margin-bottom: 8px;
+        }
+    
+        .desc {
+            font-size: 14px;
+            color: #333;
+            margin-bottom: 6px;
+            line-height: 1.6;
+        }
+    
+        .date, .source {
+            font-size: 12px;
+            color: #777;
+            margin-top: 4px;
+        }
+    </style>
+</head>
+<body>
+<div class="container">
+    <h1>گزیده اخبار</h1>
+    $last_updated
+    <div style="font-weight: bold; text-align: center; margin-bottom: 26px;">
+        <a href="https://www.pishkhan.com/all" target="_blank" style="
+            background-color: #0056b3;
+            color: white;
+            padding: 14px 28px;
+            border-radius: 10px;
+            text-decoration: none;
+            font-weight: bold;
+            font-size: 18px;
+            box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+            display: inline-block;
+            transition: background-color 0.3s ease;
+        " onmouseover="this.style.backgroundColor='#003f7f'" onmouseout="this.style.backgroundColor='#0056b3'">
+            📰 صفحه اول روزنامه‌های امروز
+        </a>
+        <a href="$root/search.html" style="
+            color: #0056b3;
+            padding: 14px 20px;
+            text-decoration: none;
+            font-size: 18px;
+            display: inline-block;
+        ">
+            🔍 جستجو در اخبار
+        </a>
+    </div>
+    <div class="grid">
+""")
+
+MOBILE_TEMPLATE = Template("""
+<!DOCTYPE html>
+<html lang="fa" dir="rtl">
+<head>
+    <meta charset="UTF-8">
+    <meta name="content-hash" content="$content_hash">
+    <title>اخبار گزیده روز</title>
+    <style>
+        html, body {
+            margin: 0;
+            padding: 0;
+            font-family: 'Segoe UI', sans-serif;
+            background: #f4f6f8;
+            direction: rtl;
+            overflow-x: hidden;
+            overflow-y: auto;
+        }
+
+        h1 {
+            text-align: center;
+            color: #1a237e;
+            font-size: 32px;
+            font-weight: bold;
+            margin: 20px 0 10px;
+        }
+
+        .container {
+            padding: 0 20px 30px;
+            box-sizing: border-box;
+        }
+
+        .grid {
+            display: grid;
+            grid-template-columns: repeat(2, 1fr);
+            gap: 10px;
+            height: calc(80vh - 150px);
+            overflow: hidden;
+        }
+
+        .category {
+            background: #ffffff;
+            border-radius: 10px;
+            box-shadow: 0 2px 6px rgba(0, 0, 0, 0.06);
+            display: flex;
+            flex-direction: column;
+            overflow-y: auto;
+        }
+
+        .category-title {
+            background-color: #1a237e;
+            color: #ffffff;
+            font-size: 18px;
+            font-weight: bold;
+            padding: 10px;
+            text-align: center;
+            position: sticky;
+            top: 0;
+            z-index: 10;
+            box-shadow: 0 1px 4px rgba(0, 0, 0, 0.08);
+        }
+
+        .article {
+            border-bottom: 1px solid #e0e0e0;
+            padding: 10px;
+            background-color: #fdfdfd;
+            border-radius: 6px;
+            margin: 8px;
+        }
+
+        .article img {
+            width: 100%;
+            max-height: 140px;
+            object-fit: cover;
+            border-radius: 6px;
+            margin-bottom: 8px;
+        }
+
+        .title {
+            font-size: 16px;
+            font-weight: 700;
+            color: #0d47a1;
+            text-decoration: none;
+            display: block;
+            margin-bottom: 6px;
+        }
+
+        .desc {
+            font-size: 13px;
+            color: #444;
+            margin-bottom: 6px;
+            line-height: 1.5;
+        }
+
+        .date, .source {
+            font-size: 11px;
+            color: #757575;
+        }
+
+        .top-button {
+            font-size: 16px;
+            padding: 10px 24px;
+            border-radius: 8px;
+            background-color: #3949ab;
+            color: white;
+            text-decoration: none;
+            display: inline-block;
+            font-weight: bold;
+            box-shadow: 0 3px 6px rgba(0,0,0,0.1);
+            transition: background-color 0.3s ease;
+        }
+
+        .top-button:hover {
+            background-color: #2c387e;
+        }
+    </style>
+</head>
+<body>
+<div class="container">
+    <h1>گزیده اخبار</h1>
+    <div style="font-size: 13px; color: #666; text-align: center; margin-bottom: 12px;">
+        $last_updated
+    </div>
+    <div style="text-align: center; margin-bottom: 20px;">
+        <a href="https://www.pishkhan.com/all" target="_blank" class="top-button">
+            📰 صفحه اول روزنامه‌های امروز
+        </a>
+        <a href="$root/search.html" class="top-button">
+            🔍 جستجو
+        </a>
+    </div>
+    <div class="grid">
+""")
+
+FOOTER = Template("""
+    </div> <!-- end of .grid -->$nav
+    <div style="margin-top: 40px; padding: 20px; background-color: #fff; border-top: 1px solid #ccc; border-radius: 10px; box-shadow: 0 -2px 8px rgba(0,0,0,0.05); font-size: 15px; color: #444; line-height: 1.8;">
+    <p style="margin: 0; text-align: justify;">
+        این صفحه گزیده‌ای از آخرین اخبار منتشرشده توسط منابع خبری معتبر ایرانی است و به‌صورت دسته‌بندی‌شده نمایش داده می‌شود. اطلاعات حدودا هر ۳۰ دقیقه یک‌بار به‌روزرسانی می‌شود و
+        منابعی مانند <strong>تسنیم</strong>، <strong>ایسنا</strong>، <strong>ایرنا</strong>، <strong>اقتصاد آنلاین</strong>، <strong>همشهری</strong> و <strong>باشگاه خبرنگاران جوان</strong> از جمله خبرگزاری‌هایی هستند که مطالب آن‌ها در این صفحه نمایش داده می‌شود.
+    </p>
+</div>
+</div> <!-- end of .container -->$script
+</body>
+</html>
+""")
+
+ARCHIVE_NAV_TEMPLATE = Template("""
+    <div style="text-align: center; margin-top: 24px; font-size: 16px; font-weight: bold;">$links</div>""")
+
+ARCHIVE_LINK_TEMPLATE = Template("""<a href="$href" style="color: #0056b3; margin: 0 12px; text-decoration: none;">$label</a>""")
+
+# Renders the articles kept out of the page (JSON mode) when a column is scrolled to its end.
+LAZY_SCRIPT_TEMPLATE = Template("""
+<script>
+(function () {
+    var data = null;
+    function load() {
+        data = data || fetch("$data_url").then(function (r) { return r.json(); });
+        return data;
+    }
+    function el(tag, cls, text) {
+        var e = document.createElement(tag);
+        if (cls) e.className = cls;
+        if (text) e.textContent = text;
+        return e;
+    }
+    function card(a) {
+        var div = el("div", "article");
+        if (a[4]) {
+            var img = el("img");
+            img.src = a[4]; img.alt = "تصویر"; img.loading = "lazy"; img.decoding = "async";
+            img.width = 320; img.height = 160;
+            div.appendChild(img);
+        }
+        var link = el("a", "title", a[0]);
+        link.href = a[1]; link.target = "_blank";
+        div.appendChild(link);
+        div.appendChild(el("div", "date", a[2]));
+        div.appendChild(el("div", "source", "📌 " + a[3]));
+        if (a[6].length) {
+            var also = el("div", "source", "🔗 همچنین در: ");
+            a[6].forEach(function (o, i) {
+                var other = el("a", null, o[0]);
+                other.href = o[1]; other.target = "_blank";
+                if (i) also.appendChild(document.createTextNode("، "));
+                also.appendChild(other);
+            });
+            div.appendChild(also);
+        }
+        if (a[5]) div.appendChild(el("div", "desc", a[5]));
+        return div;
+    }
+    document.querySelectorAll(".category[data-more]").forEach(function (column) {
+        var sentinel = el("div"), pos = 0, index = +column.dataset.more;
+        column.appendChild(sentinel);
+        var observer = new IntersectionObserver(function (entries) {
+            if (!entries[0].isIntersecting) return;
+            observer.unobserve(sentinel);
+            load().then(function (d) {
+                var items = d[index].slice(pos, pos + $batch);
+                pos += items.length;
+                items.forEach(function (a) { column.insertBefore(card(a), sentinel); });
+                if (pos < d[index].length) observer.observe(sentinel);
+            });
+        }, {root: column});
+        observer.observe(sentinel);
+    });
+})();
+</script>""")
+
+# --- Limits ---
+CATEGORY_LIMIT = 20       # articles on the first page of each category
+CATEGORY_LIMITS = {}      # per-category overrides of CATEGORY_LIMIT
+ARCHIVE_DIR = "archive"
+ARCHIVE_PAGE_SIZE = 50    # articles per category on each archive page
+LAZY_BATCH_SIZE = 20      # articles appended per scroll in JSON mode
+FRAGMENT_DIR = "fragments"
+
+CONTENT_HASH_RE = re.compile(r'<meta name="content-hash" content="([0-9a-f]+)">')
+CONTENT_HASH_SCAN = 1024  # the meta tag sits at the top of <head>
+
+IMAGE_ATTRS = 'loading="lazy" decoding="async" width="320" height="160"'
+
+# --- Variants ---
+# Each output page is a template plus the parts of an article card it shows.
+# Adding a layout means adding an entry here, not another loop over the articles.
+Variant = namedtuple("Variant", "name path template show_desc")
+
+VARIANTS = (
+    Variant("desktop", "desktop.html", DESKTOP_TEMPLATE, True),
+    Variant("mobile", "mobile.html", MOBILE_TEMPLATE, False),
+)
+
+def escape(s):
+    return html.escape(s or "", quote=False)
+
+def escape_attr(s):
+    return html.escape(s or "", quote=True)
+
+def page_root(path):
+    return os.path.relpath(".", os.path.dirname(path) or ".")
+
+def image_src(image, root):
+    """Thumbnails are relative to the site root; make them relative to the page. Other URLs pass as they are."""
+    return f"{root}/{image}" if root != "." and image.startswith(THUMB_DIR + "/") else image
+
+def render_card(article, root="."):
+    """Return the (head, desc) fragments of an article card; a card is head + [desc] + '</div>'."""
+    parts = ['<div class="article">']
+    if article.image:
+        parts.append(f'<img src="{escape_attr(image_src(article.image, root))}" alt="تصویر" {IMAGE_ATTRS}>')
+    parts.append(f'<a class="title" href="{escape_attr(article.link)}" target="_blank">{escape(article.title)}</a>')
+    parts.append(f'<div class="date">{escape(article.date)}</div>')
+    parts.append(f'<div class="source">📌 {escape(article.source)}</div>')
+    if article.also:
+        others = "، ".join(
+            f'<a href="{escape_attr(other["link"])}" target="_blank">{escape(other["source"])}</a>'
+            for other in article.also
+        )
+        parts.append(f'<div class="source">🔗 همچنین در: {others}</div>')
+    return "".join(parts), f'<div class="desc">{escape(article.desc)}</div>'
+
+def compact_article(article, show_desc):
+    return [article.title, article.link, article.date, article.source,
+            article.image or "", article.desc if show_desc else "",
+            [[other["source"], other["link"]] for other in article.also]]
+
+def split_pages(category_articles, limits=None):
+    """Split each category into its first-page slice and archive page slices.
+
+    Returns a list of pages, each a list of (category, articles) in category
+    order; archive pages only list categories that still have articles.
+    """
+    limits = limits or {}
+    pages = [[]]
+    for category, articles in category_articles.items():
+        limit = limits.get(category, CATEGORY_LIMIT)
+        pages[0].append((category, articles[:limit]))
+        for n, start in enumerate(range(limit, len(articles), ARCHIVE_PAGE_SIZE), 1):
+            if n == len(pages):
+                pages.append([])
+            pages[n].append((category, articles[start:start + ARCHIVE_PAGE_SIZE]))
+    return pages
+
+def archive_path(variant, n):
+    return variant.path if n == 0 else os.path.join(ARCHIVE_DIR, f"{variant.name}-{n}.html")
+
+def archive_nav(variant, n, count):
+    def link(target, label):
+        href = os.path.relpath(archive_path(variant, target), os.path.dirname(archive_path(variant, n)) or ".")
+        return ARCHIVE_LINK_TEMPLATE.substitute(href=href, label=label)
+
+    links = []
+    if n > 0:
+        links.append(link(n - 1, "→ اخبار جدیدتر"))
+    if n + 1 < count:
+        links.append(link(n + 1, "اخبار قدیمی‌تر ←"))
+    return ARCHIVE_NAV_TEMPLATE.substitute(links="".join(links)) if links else ""
+
+def render_column(variant, category_head, cards):
+    parts = [category_head]
+    for head, desc in cards:
+        parts.append(head)
+        if variant.show_desc:
+            parts.append(desc)
+        parts.append("</div>")
+    parts.append("</div>")
+    return "".join(parts)
+
+def page_hash(path):
+    """The content hash stamped into an existing page, or None."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            match = CONTENT_HASH_RE.search(f.read(CONTENT_HASH_SCAN))
+    except OSError:
+        return None
+    return match.group(1) if match else None
+
+def write_page(path, variant, last_updated, columns, nav="", script=""):
+    """Write a page unless its content, ignoring the timestamp, is unchanged; returns whether it wrote.
+
+    The hash covers the template, the articles and the navigation but not
+    ``last_updated``, so a run that found nothing new leaves the file (and
+    its "last updated" line) alone.
+    """
+    root = page_root(path)
+    # Each column is encoded once; the same bytes are hashed and then written as they are
+    body = [render_column(variant, category_head, cards).encode("utf-8") for category_head, cards in columns]
+    footer = FOOTER.substitute(nav=nav, script=script).encode("utf-8")
+    digest = content_hash(variant.template.template, root, *body, footer)
+    if page_hash(path) == digest:
+        return False
+    head = variant.template.substitute(last_updated=last_updated, root=root, content_hash=digest)
+    with atomic_file(path) as f:
+        f.write(head.encode("utf-8"))
+        f.writelines(body)
+        f.write(footer)
+    return True
+
+def fragment_path(variant, category):
+    key = hashlib.sha1(category.encode("utf-8")).hexdigest()[:8]
+    return os.path.join(FRAGMENT_DIR, f"{variant.name}-{key}.html")
+
+def fragment_index_path(variant):
+    return os.path.join(FRAGMENT_DIR, f"{variant.name}.json")
+
+def write_fragments(variant, columns):
+    """Write each category column as its own file, plus ``<variant>.json`` listing them.
+
+    Only fragments whose markup changed are rewritten, so a new article in one
+    category touches that category's file alone.
+    """
+    os.makedirs(FRAGMENT_DIR, exist_ok=True)
+    index = []
+    written = 0
+    for category, (category_head, cards) in columns:
+        path = fragment_path(variant, category)
+        markup = render_column(variant, category_head, cards)
+        written += write_if_changed(path, markup)
+        index.append({"category": category, "file": os.path.basename(path), "hash": content_hash(markup)})
+    write_if_changed(fragment_index_path(variant), json.dumps(index, ensure_ascii=False, separators=(",", ":")))
+    current = {entry["file"] for entry in index}
+    for name in os.listdir(FRAGMENT_DIR):
+        if name.startswith(f"{variant.name}-") and name.endswith(".html") and name not in current:
+            os.remove(os.path.join(FRAGMENT_DIR, name))
+    return written
+
+def render_pages(category_articles, updated_at, variants=VARIANTS, limits=None, json_mode=False, report=None,
+                 fragments=False, compressor=None):
+    """Write every variant page, rendering each article's markup only once.
+
+    Each category shows its newest ``CATEGORY_LIMIT`` articles (or its entry in
+    ``limits``). The rest go to paginated archive pages, or with ``json_mode`` to
+    a compact ``<variant>.json`` that the page renders as a column is scrolled.
+    With ``fragments`` each first-page category column is also written to
+    ``fragments/``. Files whose content did not change are not rewritten.
+    Each variant's files are handed to ``compressor`` (see compress.Compressor)
+    as soon as they are written, so they compress while the next variant renders.
+    Card rendering and page writing are timed as the "render" and "write"
+    stages of ``report``.
+    """
+    stage = report.stage if report else (lambda name: nullcontext())
+    with stage("render"):
+        last_updated = LAST_UPDATED_TEMPLATE.substitute(updated_at=updated_at)
+        limits = {**CATEGORY_LIMITS, **(limits or {})}
+        pages = split_pages(category_articles, limits)
+        roots = [page_root(archive_path(variants[0], n)) for n in range(len(pages))]
+        cards = {
+            id(article): render_card(article, roots[n])
+            for n, page in enumerate(pages) for _, articles in page for article in articles
+        }
+        first_page = [(category, [cards[id(a)] for a in articles]) for category, articles in pages[0]]
+
+    for variant in variants:
+        with stage("write"):
+            if json_mode:
+                data_path = os.path.splitext(variant.path)[0] + ".json"
+                overflow = [
+                    [compact_article(a, variant.show_desc) for a in category_articles[category][len(articles):]]
+                    for category, articles in pages[0]
+                ]
+                write_if_changed(data_path, json.dumps(overflow, ensure_ascii=False, separators=(",", ":")))
+                columns = [
+                    (f'<div class="category" data-more="{i}"><div class="category-title">{escape(category)}</div>', page_cards)
+                    for i, (category, page_cards) in enumerate(first_page)
+                ]
+                script = LAZY_SCRIPT_TEMPLATE.substitute(data_url=os.path.basename(data_path), batch=LAZY_BATCH_SIZE)
+                written = write_page(variant.path, variant, last_updated, columns, script=script)
+                page_count = 1
+                outputs = [variant.path, data_path]
+            else:
+                page_count = len(pages)
+                written = 0
+                for n, page in enumerate(pages):
+                    columns = [
+                        (f'<div class="category"><div class="category-title">{escape(category)}</div>',
+                         [cards[id(a)] for a in articles])
+                        for category, articles in page
+                    ]
+                    path = archive_path(variant, n)
+                    written += write_page(path, variant, last_updated, columns, nav=archive_nav(variant, n, page_count))
+                outputs = [archive_path(variant, n) for n in range(page_count)]
+            remove_stale_archives(variant, page_count)
+            if fragments:
+                columns = [
+                    (category, (f'<div class="category"><div class="category-title">{escape(category)}</div>', page_cards))
+                    for category, page_cards in first_page
+                ]
+                written += write_fragments(variant, columns)
+                outputs += [fragment_path(variant, category) for category, _ in first_page] + [fragment_index_path(variant)]
+            print(f"✅ {variant.name} version..." + ("" if written else " (unchanged)"))
+        if compressor is not None:
+            for path in outputs:
+                compressor.submit(path)
+
+def remove_stale_archives(variant, page_count):
+    n = page_count
+    while os.path.exists(archive_path(variant, n)):
+        os.remove(archive_path(variant, n))
+        n += 1
@@ -0,0 +1,107 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from .output import atomic_write
+
+REPORT_PATH = os.path.join(".cache", "run-report.json")
+
+
+class RunReport:
+    """Timings and counters for one crawl, written as JSON and optionally as a
+    Prometheus textfile.
+
+    ``stages`` accumulates wall time per pipeline stage; ``feeds`` holds one
+    record per feed URL (fetch timings, bytes, status, parse time, item counts
+    and the class of any error).
+    """
+
+    def __init__(self):
+        self.started = time.time()
+        self.stages = {}
+        self.feeds = {}
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name, seconds):
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def feed(self, url, **fields):
+        record = self.feeds.setdefault(url, {"url": url, "host": urlsplit(url).hostname, "error": None})
+        record.update(fields)
+        return record
+
+    def error(self, url, stage, exc):
+        self.feed(url, error=type(exc).__name__, error_stage=stage, error_message=str(exc)[:200])
+        print(f"⚠️ {stage} failed for {url}: {type(exc).__name__}: {exc}")
+
+    def as_dict(self):
+        feeds = list(self.feeds.values())
+        return {
+            "started": self.started,
+            "duration_s": round(time.time() - self.started, 4),
+            "stages": {name: round(seconds, 4) for name, seconds in self.stages.items()},
+            "feeds_total": len(feeds),
+            "feeds_failed": sum(1 for f in feeds if f["error"]),
+            "feeds": feeds,
+        }
+
+    def write_json(self, path=REPORT_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.as_dict(), f, ensure_ascii=False, indent=1)
+
+    def write_prometheus(self, path):
+        """Write a node_exporter textfile-collector file (atomically, as it expects)."""
+        report = self.as_dict()
+        lines = [
+            "# TYPE newsfeed_run_timestamp_seconds gauge",
+            f"newsfeed_run_timestamp_seconds {report['started']:.0f}",
+            "# TYPE newsfeed_run_duration_seconds gauge",
+            f"newsfeed_run_duration_seconds {report['duration_s']}",
+            "# TYPE newsfeed_stage_seconds gauge",
+        ]
+        lines += [f'newsfeed_stage_seconds{{stage="{_label(name)}"}} {seconds}' for name, seconds in report["stages"].items()]
+
+        per_feed = (
+            ("newsfeed_feed_up", lambda f: 0 if f["error"] else 1),
+            ("newsfeed_feed_http_status", lambda f: f.get("status")),
+            ("newsfeed_feed_attempts", lambda f: f.get("attempts")),
+            ("newsfeed_feed_stale", lambda f: 1 if f.get("stale") else 0),
+            ("newsfeed_feed_ttfb_seconds", lambda f: f.get("ttfb_s")),
+            ("newsfeed_feed_download_seconds", lambda f: f.get("download_s")),
+            ("newsfeed_feed_bytes", lambda f: f.get("bytes")),
+            ("newsfeed_feed_parse_seconds", lambda f: f.get("parse_s")),
+            ("newsfeed_feed_items", lambda f: f.get("items")),
+            ("newsfeed_feed_new_items", lambda f: f.get("new")),
+            ("newsfeed_feed_duplicate_items", lambda f: f.get("duplicates")),
+        )
+        for metric, value in per_feed:
+            lines.append(f"# TYPE {metric} gauge")
+            for feed in report["feeds"]:
+                v = value(feed)
+                if v is not None:
+                    lines.append(f'{metric}{{host="{_label(feed["host"])}",url="{_label(feed["url"])}"}} {v}')
+
+        atomic_write(path, "\n".join(lines) + "\n")
+
+    def summary(self):
+        stages = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in self.stages.items())
+        failed = [f["url"] for f in self.feeds.values() if f["error"]]
+        slowest = max(self.feeds.values(), key=lambda f: f.get("fetch_s") or 0, default=None)
+        line = f"⏱️ {stages}; {len(self.feeds)} feeds, {len(failed)} failed"
+        if slowest and slowest.get("fetch_s"):
+            line += f"; slowest fetch {slowest['host']} {slowest['fetch_s']:.2f}s"
+        return line
+
+
+def _label(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
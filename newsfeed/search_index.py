@@ -0,0 +1,172 @@
+import hashlib
+import json
+import os
+import time
+
+from .article_store import normalize_link
+from .output import atomic_write
+from .persian_text import tokenize
+
+INDEX_DIR = "search"
+STATE_PATH = os.path.join(".cache", "search-state.json")
+INDEX_VERSION = 1
+PREFIX_LENGTH = 2  # term shards are keyed by the first characters of the normalized term
+
+STOPWORDS = frozenset(tokenize(
+    "و در به از که این را با برای است آن یک تا بر هم شد شده می نیز کرد کرده "
+    "خود ها های ای باید گفت اما یا پس بود دارد شود کند داد the of and to in"
+))
+
+
+def doc_id(article):
+    return hashlib.sha1(normalize_link(article.link).encode("utf-8")).hexdigest()[:10]
+
+
+def doc_record(category, article):
+    return [article.title, article.link, article.source, article.date, category]
+
+
+def doc_terms(article):
+    words = tokenize(f"{article.title} {article.desc or ''}")
+    return sorted({w for w in words if len(w) >= PREFIX_LENGTH and w not in STOPWORDS})
+
+
+def term_shard(term):
+    return "t-" + term[:PREFIX_LENGTH].encode("utf-8").hex()
+
+
+def doc_shard(doc):
+    return "d-" + doc[0]
+
+
+def _read_json(path, default):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def _write_json(path, data):
+    atomic_write(path, json.dumps(data, ensure_ascii=False, separators=(",", ":")))
+
+
+class SearchIndex:
+    """Client-side search index: an inverted index sharded into small JSON files.
+
+    ``search/t-<hex prefix>.json`` maps terms to doc ids and ``search/d-<x>.json``
+    maps doc ids to [title, link, source, date, category], so a query only
+    loads the shards of its own terms and hits. Each run diffs the current
+    articles against the previous run (tracked in ``.cache``) and rewrites only
+    the shards that changed; without that state the index is rebuilt.
+    """
+
+    def __init__(self, directory=INDEX_DIR, state_path=STATE_PATH):
+        self.directory = directory
+        self.state_path = state_path
+
+    def _path(self, shard):
+        return os.path.join(self.directory, f"{shard}.json")
+
+    def _load_state(self):
+        state = _read_json(self.state_path, None)
+        meta = _read_json(os.path.join(self.directory, "meta.json"), None)
+        if not state or not meta or state.get("version") != INDEX_VERSION or meta.get("docs") != len(state["docs"]):
+            return None
+        return state
+
+    def update(self, category_articles):
+        started = time.perf_counter()
+        os.makedirs(self.directory, exist_ok=True)
+
+        current = {}
+        for category, articles in category_articles.items():
+            for article in articles:
+                current.setdefault(doc_id(article), (category, article))
+
+        state = self._load_state()
+        if state is None:
+            # Full rebuild: start from an empty index
+            for name in os.listdir(self.directory):
+                if name.endswith(".json"):
+                    os.remove(os.path.join(self.directory, name))
+            state = {"version": INDEX_VERSION, "docs": {}}
+        previous = state["docs"]  # doc id -> [record, terms]
+
+        records = {doc: doc_record(category, article) for doc, (category, article) in current.items()}
+        removed = [doc for doc in previous if doc not in records or previous[doc][0] != records[doc]]
+        added = [doc for doc in records if doc not in previous or previous[doc][0] != records[doc]]
+
+        term_changes = {}  # shard -> list of (term, doc, present)
+        doc_changes = {}   # shard -> list of (doc, record or None)
+        for doc in removed:
+            for term in previous[doc][1]:
+                term_changes.setdefault(term_shard(term), []).append((term, doc, False))
+            doc_changes.setdefault(doc_shard(doc), []).append((doc, None))
+            del previous[doc]
+        for doc in added:
+            terms = doc_terms(current[doc][1])
+            for term in terms:
+                term_changes.setdefault(term_shard(term), []).append((term, doc, True))
+            doc_changes.setdefault(doc_shard(doc), []).append((doc, records[doc]))
+            previous[doc] = [records[doc], terms]
+
+        for shard, changes in term_changes.items():
+            postings = _read_json(self._path(shard), {})
+            # One set per touched term, sorted once: a common term can change for thousands of docs in a run
+            touched = {}
+            for term, doc, present in changes:
+                docs = touched.get(term)
+                if docs is None:
+                    docs = touched[term] = set(postings.get(term, ()))
+                if present:
+                    docs.add(doc)
+                else:
+                    docs.discard(doc)
+            for term, docs in touched.items():
+                if docs:
+                    postings[term] = sorted(docs)
+                else:
+                    postings.pop(term, None)
+            self._save_shard(shard, postings)
+
+        for shard, changes in doc_changes.items():
+            docs = _read_json(self._path(shard), {})
+            for doc, record in changes:
+                if record is None:
+                    docs.pop(doc, None)
+                else:
+                    docs[doc] = record
+            self._save_shard(shard, docs)
+
+        sizes = {
+            name[:-5]: os.path.getsize(os.path.join(self.directory, name))
+            for name in sorted(os.listdir(self.directory))
+            if name.endswith(".json") and name != "meta.json"
+        }
+        _write_json(os.path.join(self.directory, "meta.json"), {
+            "version": INDEX_VERSION, "prefix": PREFIX_LENGTH, "docs": len(previous), "shards": sizes,
+            "stopwords": sorted(STOPWORDS),
+        })
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+        _write_json(self.state_path, state)
+
+        elapsed = time.perf_counter() - started
+        largest = max(sizes.values(), default=0)
+        print(
+            f"🔎 Search index: {len(previous)} docs (+{len(added)} / -{len(removed)}), "
+            f"{len(term_changes) + len(doc_changes)} of {len(sizes)} shards rewritten in {elapsed:.2f}s, "
+            f"{sum(sizes.values()) / 1024:.1f} KB total, largest shard {largest / 1024:.1f} KB"
+        )
+        return {"docs": len(previous), "added": len(added), "removed": len(removed),
+                "seconds": elapsed, "shards": sizes}
+
+    def files(self):
+        """Paths of every file in the index, meta.json included."""
+        return [os.path.join(self.directory, name) for name in sorted(os.listdir(self.directory)) if name.endswith(".json")]
+
+    def _save_shard(self, shard, data):
+        if data:
+            _write_json(self._path(shard), data)
+        elif os.path.exists(self._path(shard)):
+            os.remove(self._path(shard))
@@ -0,0 +1,42 @@
+feeds = {
+    "اقتصاد": {
+        "تسنیم": "https://www.tasnimnews.com/fa/rss/feed/0/7/7/%D8%A7%D9%82%D8%AA%D8%B5%D8%A7%D8%AF%DB%8C",
+        "اقتصاد آنلاین": "https://www.eghtesadonline.com/fa/rss/8",
+        "باشگاه خبرنگاران": "https://www.yjc.ir/fa/rss/6",
+        "ایرنا": "https://www.irna.ir/rss/tp/20",
+        "ایسنا": "https://www.isna.ir/rss/tp/34",
+        "جام جم": "https://jamejamonline.ir/fa/rss/15",
+        "جوان": "https://www.javanonline.ir/fa/rss/6",
+        "همشهری": "https://www.hamshahrionline.ir/rss/tp/10"
+    },
+    "بورس، بانک و بیمه": {
+        "(بورس) ایرنا": "https://www.irna.ir/rss/tp/1001669",
+        "(بورس) اقتصاد آنلاین": "https://www.eghtesadonline.com/fa/rss/9",
+        "بورس پرس": "https://boursepress.ir/rss/feeds/featured",
+        "(بانک و بیمه) ایرنا": "https://www.irna.ir/rss/tp/26",
+        "(بانک و بیمه) اقتصاد آنلاین": "https://www.eghtesadonline.com/fa/rss/25",
+        "(بورس) همشهری": "https://www.hamshahrionline.ir/rss/tp/683",
+        "(بانک و بیمه) همشهری": "https://www.hamshahrionline.ir/rss/tp/92"
+    },
+    "صنعت، معدن و تجارت": {
+        "ایرنا": "https://www.irna.ir/rss/tp/23",
+        "اقتصاد آنلاین": "https://www.eghtesadonline.com/fa/rss/26",
+        "ایسنا": "https://www.isna.ir/rss/tp/74",
+        "همشهری": "https://www.hamshahrionline.ir/rss/tp/87"
+    },
+    "سیاسی و اجتماعی": {
+        "(جهانی) ایرنا": "https://www.irna.ir/rss/tp/1",
+        "(بین‌الملل) تسنیم": "https://www.tasnimnews.com/fa/rss/feed/0/7/8/%D8%A8%DB%8C%D9%86-%D8%A7%D9%84%D9%85%D9%84%D9%84",
+        "(جهانی) باشگاه خبرنگاران": "https://www.yjc.ir/fa/rss/9",
+        "(سیاسی) تسنیم": "https://www.tasnimnews.com/fa/rss/feed/0/7/1/%D8%B3%DB%8C%D8%A7%D8%B3%DB%8C",
+        "(سیاسی) اقتصاد آنلاین": "https://www.eghtesadonline.com/fa/rss/11",
+        "(سیاسی) باشگاه خبرنگاران": "https://www.yjc.ir/fa/rss/3",
+        "(سیاسی) همشهری": "https://www.hamshahrionline.ir/rss/tp/6",
+        "(بین‌المللی) همشهری": "https://www.hamshahrionline.ir/rss/tp/11",
+        "(سیاسی) جام جم": "https://jamejamonline.ir/fa/rss/17",
+        "(جهانی) جام جم": "https://jamejamonline.ir/fa/rss/12",
+        "(سیاسی) جوان": "https://www.javanonline.ir/fa/rss/3",
+        "(جهانی) جوان": "https://www.javanonline.ir/fa/rss/2",
+        "(جهانی) ایسنا": "https://www.isna.ir/rss/tp/17"
+    }
+}
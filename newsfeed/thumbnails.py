@@ -0,0 +1,202 @@
+import hashlib
+import io
+import json
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from urllib.parse import urlsplit
+
+from .fetch_policy import Deadline, DeadlineExceeded
+from .fetching import FETCH_TIMEOUT, FETCH_WORKERS, PER_HOST_LIMIT, make_session
+from .output import atomic_write
+
+THUMB_DIR = "thumbs"  # published next to the pages; image paths are relative to the site root
+CACHE_DIR = os.path.join(".cache", "images")
+INDEX_PATH = os.path.join(CACHE_DIR, "index.json")
+THUMB_SIZE = (640, 320)  # 2x the 320x160 box cards reserve (IMAGE_ATTRS); CSS crops to 160px / 140px high
+WEBP_QUALITY = 75
+JPEG_QUALITY = 80
+MAX_IMAGE_BYTES = 8 * 1024 * 1024
+MAX_DOWNLOADS = 300       # per run, newest articles first; the rest keep hotlinking until a later run
+IMAGE_DEADLINE = 45       # seconds for the whole download phase
+RETRY_AFTER = 6 * 3600    # a url that failed is not tried again for this long
+MAX_AGE = 14 * 86400      # images no article has referenced for this long are dropped
+
+
+def _pillow():
+    # Optional: only needed when thumbnails are enabled
+    try:
+        from PIL import Image, ImageOps, features
+    except ImportError:
+        return None
+    return Image, ImageOps, features
+
+
+class ThumbnailCache:
+    """Downloads article images once and serves small local thumbnails instead.
+
+    Images are keyed by the SHA-256 of their bytes, so the same picture
+    published by several sources, or under several URLs, is thumbnailed once.
+    Each gets one WebP thumbnail (JPEG when Pillow lacks WebP support) in
+    ``thumbs/``, cropped to the card's aspect ratio at twice its size; the
+    original is not kept, so a thumbnail that goes missing is downloaded again.
+
+    ``.cache/images/index.json`` maps image URLs to content hashes and records
+    when each was last referenced; entries unseen for MAX_AGE are evicted with
+    their thumbnails.
+    """
+
+    def __init__(self, thumb_dir=THUMB_DIR, index_path=INDEX_PATH):
+        self.thumb_dir = thumb_dir
+        self.index_path = index_path
+        self.pil = _pillow()
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                index = json.load(f)
+            self.urls, self.blobs = index["urls"], index["blobs"]
+        except (OSError, ValueError, KeyError):
+            self.urls, self.blobs = {}, {}
+        if self.pil and self.pil[2].check("webp"):
+            self.extension, self.save_args = ".webp", {"format": "WEBP", "quality": WEBP_QUALITY, "method": 4}
+        else:
+            self.extension, self.save_args = ".jpg", {"format": "JPEG", "quality": JPEG_QUALITY, "optimize": True}
+
+    def thumb_path(self, digest):
+        return f"{self.thumb_dir}/{digest[:20]}{self.extension}"
+
+    def apply(self, category_articles):
+        """Return ``category_articles`` with images replaced by local thumbnails where available."""
+        if self.pil is None:
+            print("⚠️ Thumbnails: Pillow is not installed, keeping publisher image URLs")
+            return category_articles
+        now = time.time()
+        newest = {}
+        for articles in category_articles.values():
+            for article in articles:
+                if article.image and "://" in article.image:
+                    newest[article.image] = max(newest.get(article.image, 0), article.sort_key)
+
+        missing = [
+            url for url in sorted(newest, key=newest.get, reverse=True)
+            if not self._thumb(url) and self.urls.get(url, {}).get("retry", 0) <= now
+        ][:MAX_DOWNLOADS]
+        fetched, failed, shared = self._fetch(missing, now)
+
+        thumbs = {}
+        for url in newest:
+            entry = self.urls.setdefault(url, {})
+            entry["seen"] = now
+            thumb = self._thumb(url)
+            if thumb:
+                thumbs[url] = thumb
+                self.blobs[entry["sha"]]["seen"] = now
+        self._evict(now)
+        self._save()
+
+        print(f"🖼️ Thumbnails: {len(thumbs)} of {len(newest)} images local, {fetched} downloaded "
+              f"({shared} duplicates of cached images), {failed} failed")
+        return {
+            category: [article._replace(image=thumbs[article.image]) if article.image in thumbs else article
+                       for article in articles]
+            for category, articles in category_articles.items()
+        }
+
+    def _thumb(self, url):
+        digest = self.urls.get(url, {}).get("sha")
+        blob = self.blobs.get(digest)
+        return blob["thumb"] if blob and os.path.exists(blob["thumb"]) else None
+
+    # --- Downloading ---
+    def _fetch(self, urls, now):
+        if not urls:
+            return 0, 0, 0
+        deadline = Deadline(IMAGE_DEADLINE)
+        session = make_session()
+        host_slots = {urlsplit(url).hostname: threading.BoundedSemaphore(PER_HOST_LIMIT) for url in urls}
+        known = set(self.blobs)
+        fetched = failed = shared = 0
+
+        def download(url):
+            with host_slots[urlsplit(url).hostname]:
+                deadline.check(url)
+                with session.get(url, timeout=min(FETCH_TIMEOUT, deadline.remaining()), stream=True) as response:
+                    response.raise_for_status()
+                    data = bytearray()
+                    for chunk in response.iter_content(64 * 1024):
+                        data += chunk
+                        if len(data) > MAX_IMAGE_BYTES:
+                            raise ValueError(f"image larger than {MAX_IMAGE_BYTES // 1024 // 1024} MB")
+            digest = hashlib.sha256(data).hexdigest()
+            if digest not in known or not os.path.exists(self.thumb_path(digest)):
+                self._make_thumb(bytes(data), digest)
+            return digest
+
+        pool = ThreadPoolExecutor(max_workers=FETCH_WORKERS)
+        try:
+            futures = [(url, pool.submit(download, url)) for url in urls]
+            for url, future in futures:
+                try:
+                    digest = future.result(timeout=deadline.remaining())
+                except (FutureTimeout, DeadlineExceeded):
+                    continue  # not tried in time; the next run picks it up
+                except Exception:
+                    self.urls[url] = {"retry": now + RETRY_AFTER}
+                    failed += 1
+                    continue
+                fetched += 1
+                shared += digest in self.blobs
+                self.urls[url] = {"sha": digest}
+                self.blobs[digest] = {"thumb": self.thumb_path(digest), "seen": now}
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+            session.close()
+        return fetched, failed, shared
+
+    def _make_thumb(self, data, digest):
+        Image, ImageOps, _ = self.pil
+        image = Image.open(io.BytesIO(data))
+        image.draft("RGB", THUMB_SIZE)  # JPEG decodes straight to a smaller scale
+        image = ImageOps.exif_transpose(image)
+        if image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info:
+            rgba = image.convert("RGBA")
+            image = Image.new("RGB", rgba.size, "white")
+            image.paste(rgba, mask=rgba)
+        image = image.convert("RGB")
+        # Crop to the card's aspect ratio, never upscaling a small picture
+        scale = min(1, image.width / THUMB_SIZE[0], image.height / THUMB_SIZE[1])
+        size = (max(1, round(THUMB_SIZE[0] * scale)), max(1, round(THUMB_SIZE[1] * scale)))
+        image = ImageOps.fit(image, size, Image.LANCZOS)
+        out = io.BytesIO()
+        image.save(out, **self.save_args)
+        atomic_write(self.thumb_path(digest), out.getvalue())
+
+    # --- Eviction ---
+    def _evict(self, now):
+        for url in [url for url, entry in self.urls.items() if entry.get("seen", now) < now - MAX_AGE]:
+            del self.urls[url]
+        used = {entry["sha"] for entry in self.urls.values() if "sha" in entry}
+        for digest in [digest for digest in self.blobs if digest not in used]:
+            self._remove(self.blobs.pop(digest)["thumb"])
+
+        # Originals stored by earlier versions under .cache/images/<xx>/
+        cache_dir = os.path.dirname(self.index_path)
+        if os.path.isdir(cache_dir):
+            for entry in os.scandir(cache_dir):
+                if entry.is_dir():
+                    shutil.rmtree(entry.path)
+
+        # Thumbnails left behind by an interrupted run or a format change
+        current = {os.path.basename(blob["thumb"]) for blob in self.blobs.values()}
+        if os.path.isdir(self.thumb_dir):
+            for name in os.listdir(self.thumb_dir):
+                if name not in current:
+                    self._remove(os.path.join(self.thumb_dir, name))
+
+    def _remove(self, path):
+        if os.path.exists(path):
+            os.remove(path)
+
+    def _save(self):
+        atomic_write(self.index_path, json.dumps({"urls": self.urls, "blobs": self.blobs}, separators=(",", ":")))